@@ -8,19 +8,57 @@ Tries multiple methods to get REAL Indonesian stock data:
 NO SYNTHETIC DATA - REAL ONLY!
 """
 
+import random
 import sys
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import StringIO
 
+# pyarrow's multithreaded CSV reader parses response bytes directly,
+# skipping the bytes -> str decode + pandas reparse round-trip
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.utils.logger import setup_logger
+from src.utils.circuit_breaker import CircuitBreaker
 
 logger = setup_logger(__name__)
 
+# Stop hammering Yahoo once it looks dead: after 3 consecutive failures
+# remaining tickers fast-fail instead of each paying the full timeout
+YAHOO_BREAKER = CircuitBreaker('yahoo_direct', failure_threshold=3, reset_after=60)
+
+# Shared session: reuses TCP+TLS connections across tickers and retries
+# transient failures with exponential backoff at the transport layer.
+# With requests-cache installed, identical queries are answered from a
+# local cache (1-day TTL) instead of re-hitting the providers.
+try:
+    from requests_cache import CachedSession
+    SESSION = CachedSession('yahoo_cache', backend='sqlite', expire_after=86400)
+except ImportError:
+    SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=1.0, status_forcelist=[])
+))
+
+# Application-level retry policy for transient provider errors; connection
+# blips are already retried by the adapter above
+MAX_RETRIES = 3
+MAX_BACKOFF = 30
+RECOVERABLE_STATUSES = {429, 500, 502, 503, 504}
+
 
 def try_investpy(ticker, start_date, end_date):
     """Try getting data from investing.com via investpy library.
@@ -62,6 +100,21 @@ def try_investpy(ticker, start_date, end_date):
     return None
 
 
+def _read_csv_response(content):
+    """Parse a CSV HTTP response body into a DataFrame.
+
+    Args:
+        content: Raw response bytes
+
+    Returns:
+        DataFrame (pyarrow-parsed when available, pandas otherwise)
+    """
+    if pa is not None:
+        return pacsv.read_csv(pa.BufferReader(content)).to_pandas()
+    return pd.read_csv(StringIO(content.decode('utf-8')))
+
+
+@YAHOO_BREAKER
 def try_yahoo_download_direct(ticker, start_date, end_date):
     """Try direct download from Yahoo Finance website (not API).
     
@@ -94,27 +147,124 @@ def try_yahoo_download_direct(ticker, start_date, end_date):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            df = pd.read_csv(StringIO(response.text))
-            
-            if not df.empty and 'Date' in df.columns:
-                logger.info(f"✅ Yahoo direct download SUCCESS: {len(df)} records for {ticker}")
-                
-                df['Ticker'] = ticker
-                df['Date'] = pd.to_datetime(df['Date'])
-                
-                return df
-        
-        logger.warning(f"Yahoo download failed: HTTP {response.status_code}")
-        
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = SESSION.get(url, params=params, headers=headers, timeout=10)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                logger.warning(
+                    f"Network error for {ticker} (attempt {attempt + 1}/{MAX_RETRIES}): {e}"
+                )
+            else:
+                if response.status_code == 200:
+                    df = _read_csv_response(response.content)
+
+                    if not df.empty and 'Date' in df.columns:
+                        logger.info(
+                            f"✅ Yahoo direct download SUCCESS: {len(df)} records for {ticker}"
+                        )
+
+                        df['Ticker'] = ticker
+                        df['Date'] = pd.to_datetime(df['Date'])
+
+                        return df
+
+                    logger.warning(f"Yahoo download returned no usable data for {ticker}")
+                    return None
+
+                if response.status_code not in RECOVERABLE_STATUSES:
+                    # Other 4xx: retrying cannot help
+                    logger.warning(f"Yahoo download failed: HTTP {response.status_code}")
+                    return None
+
+                logger.warning(
+                    f"Transient HTTP {response.status_code} for {ticker} "
+                    f"(attempt {attempt + 1}/{MAX_RETRIES})"
+                )
+
+            # Bounded exponential backoff with jitter before the next try
+            if attempt < MAX_RETRIES - 1:
+                delay = min(MAX_BACKOFF, (2 ** attempt) * (1 + random.random() * 0.5))
+                logger.info(f"Retrying {ticker} in {delay:.1f}s...")
+                time.sleep(delay)
+
     except Exception as e:
         logger.warning(f"Yahoo direct download failed for {ticker}: {e}")
-    
+
     return None
 
 
+def try_yahoo_spark_batch(tickers, data_range='6mo'):
+    """Download many tickers in one Yahoo spark-API request.
+
+    The spark endpoint accepts up to 20 comma-joined symbols per call,
+    collapsing N per-ticker round-trips into ceil(N/20) HTTP requests.
+    Note: spark only returns daily close prices, so this is a close-only
+    fallback, not full OHLCV.
+
+    Args:
+        tickers: List of stock tickers (e.g., ['BBCA.JK', 'GOTO.JK'])
+        data_range: Yahoo range string (e.g., '6mo', '1y')
+
+    Returns:
+        Dict mapping ticker -> DataFrame (Date, Close, Ticker)
+    """
+    results = {}
+
+    url = "https://query1.finance.yahoo.com/v8/finance/spark"
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+
+    # Spark accepts at most 20 symbols per request
+    batch_size = 20
+
+    for i in range(0, len(tickers), batch_size):
+        chunk = tickers[i:i + batch_size]
+        logger.info(f"Trying Yahoo spark batch for {len(chunk)} tickers...")
+
+        try:
+            params = {
+                'symbols': ','.join(chunk),
+                'interval': '1d',
+                'range': data_range
+            }
+
+            response = SESSION.get(url, params=params, headers=headers, timeout=15)
+
+            if response.status_code != 200:
+                logger.warning(f"Yahoo spark batch failed: HTTP {response.status_code}")
+                continue
+
+            for entry in response.json().get('spark', {}).get('result', []):
+                symbol = entry.get('symbol')
+                series = entry.get('response') or []
+
+                if not symbol or not series:
+                    continue
+
+                timestamps = series[0].get('timestamp')
+                closes = series[0].get('indicators', {}).get('quote', [{}])[0].get('close')
+
+                if not timestamps or not closes:
+                    continue
+
+                df = pd.DataFrame({
+                    'Date': pd.to_datetime(timestamps, unit='s').normalize(),
+                    'Close': closes
+                })
+                df.dropna(subset=['Close'], inplace=True)
+                df['Ticker'] = symbol
+
+                if len(df) > 0:
+                    logger.info(f"✅ Yahoo spark SUCCESS: {len(df)} records for {symbol}")
+                    results[symbol] = df
+
+        except Exception as e:
+            logger.warning(f"Yahoo spark batch failed: {e}")
+
+    return results
+
+
 def try_idx_website_scraping(ticker):
     """Guide user to manually download from IDX website.
     
@@ -178,6 +328,34 @@ def try_idx_website_scraping(ticker):
     return instructions
 
 
+def resilient_fetch(ticker, strategies):
+    """Try acquisition strategies in order until one yields data.
+
+    Each strategy already carries its own retry/backoff (and circuit
+    breaker where applicable); this just owns the fallback order and the
+    shared exception/logging path, so the callers don't duplicate the
+    try/except waterfall per source.
+
+    Args:
+        ticker: Stock ticker (for logging)
+        strategies: List of (name, zero-arg callable) pairs
+
+    Returns:
+        Tuple of (DataFrame, strategy name), or (None, None) if all fail
+    """
+    for name, strategy in strategies:
+        try:
+            data = strategy()
+        except Exception as e:
+            logger.warning(f"Strategy '{name}' raised for {ticker}: {e}")
+            continue
+
+        if data is not None and len(data) > 0:
+            return data, name
+
+    return None, None
+
+
 def acquire_real_data():
     """Main function to acquire REAL stock data using multiple methods."""
     
@@ -214,26 +392,32 @@ def acquire_real_data():
     manual_dir = Path("data/raw/manual")
     manual_dir.mkdir(parents=True, exist_ok=True)
     
+    # Batched spark data fetched lazily on first fallback (one request
+    # covers all tickers, but close-only - full OHLCV sources come first)
+    spark_data = {}
+
+    def spark_lookup(ticker):
+        if not spark_data:
+            spark_data.update(try_yahoo_spark_batch([f"{s}.JK" for s in stocks]))
+            spark_data.setdefault('_fetched', None)
+        return spark_data.get(ticker)
+
     for stock in stocks:
         ticker = f"{stock}.JK"
         logger.info(f"\n{'='*60}")
         logger.info(f"Attempting to acquire: {ticker}")
         logger.info(f"{'='*60}")
-        
-        data = None
-        method = None
-        
-        # Method 1: investpy
-        data = try_investpy(stock, start_str_investpy, end_str_investpy)
-        if data is not None:
-            method = "investpy"
-        
-        # Method 2: Yahoo direct download
-        if data is None:
-            data = try_yahoo_download_direct(ticker, start_date, end_date)
-            if data is not None:
-                method = "yahoo_direct"
-        
+
+        # Strategies in order of data quality; first success wins
+        data, method = resilient_fetch(ticker, [
+            ('investpy',
+             lambda s=stock: try_investpy(s, start_str_investpy, end_str_investpy)),
+            ('yahoo_direct',
+             lambda t=ticker: try_yahoo_download_direct(t, start_date, end_date)),
+            ('yahoo_spark_batch',
+             lambda t=ticker: spark_lookup(t)),
+        ])
+
         # Save if successful
         if data is not None:
             output_file = output_dir / f"{stock}_real.csv"
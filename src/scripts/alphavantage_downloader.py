@@ -8,13 +8,57 @@ Free Tier Limits:
 Get free API key: https://www.alphavantage.co/support/#api-key
 """
 
+import asyncio
+import functools
+import sys
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-from io import StringIO
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import time
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.circuit_breaker import CircuitBreaker
+
+# orjson parses JSON ~5-10x faster than stdlib; fall back if not installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def _json_loads(data):
+        return json.loads(data)
+
+# httpx enables the async download path (connection-pooled, event-loop
+# friendly); without it we fall back to the thread pool
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Parquet output needs pyarrow; fall back to CSV without it
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# polars' Rust CSV writer beats pandas' per-cell formatter by 5-10x
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -34,84 +78,277 @@ STOCKS = [
 # Output directory
 OUTPUT_DIR = Path("data/raw/alphavantage")
 
+# Compact analytics dtypes: float32 is plenty for daily prices and halves
+# memory/bandwidth versus float64
+OHLCV_DTYPES = {
+    'Open': 'float32',
+    'High': 'float32',
+    'Low': 'float32',
+    'Close': 'float32',
+    'Volume': 'int32'
+}
+
+# Rate limit: free tier allows 5 API calls per 60s window
+RATE_LIMIT_CALLS = 5
+RATE_LIMIT_WINDOW = 60
+MAX_WORKERS = 5
+
 # ============================================================================
 # FUNCTIONS
 # ============================================================================
 
-def download_stock_data(ticker, api_key):
-    """Download historical data from Alpha Vantage.
-    
+# Shared session: keeps TCP+TLS connections alive across requests and
+# retries transient failures with exponential backoff at the transport layer.
+# With requests-cache installed, responses are cached for a day so dev
+# re-runs answer from disk instead of burning the 500-calls/day quota.
+try:
+    from requests_cache import CachedSession
+    SESSION = CachedSession('av_cache', backend='sqlite', expire_after=86400)
+except ImportError:
+    SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+))
+
+# Stop issuing requests once the provider looks dead (3 consecutive
+# failures) instead of paying the full timeout for every remaining ticker
+BREAKER = CircuitBreaker('alphavantage', failure_threshold=3, reset_after=60)
+
+# Token bucket shared by all download threads
+_call_times = deque()
+_rate_lock = threading.Lock()
+
+
+def rate_limited(func):
+    """Decorator enforcing the API quota (5 calls per 60s rolling window).
+
+    Threads acquire a token before issuing a request; if the window is full,
+    they sleep until the oldest call expires. This lets multiple downloads
+    be in-flight concurrently while staying within the provider's quota.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        while True:
+            with _rate_lock:
+                now = time.monotonic()
+                # Drop timestamps that have aged out of the window
+                while _call_times and now - _call_times[0] >= RATE_LIMIT_WINDOW:
+                    _call_times.popleft()
+
+                if len(_call_times) < RATE_LIMIT_CALLS:
+                    _call_times.append(now)
+                    break
+
+                wait_time = RATE_LIMIT_WINDOW - (now - _call_times[0])
+
+            print(f"  ⏳ Rate limit reached - waiting {wait_time:.0f}s...")
+            time.sleep(wait_time)
+
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+API_URL = "https://www.alphavantage.co/query"
+
+
+def save_frame(df, path):
+    """Save DataFrame as snappy parquet (pyarrow) or CSV fallback.
+
+    Parquet writes ~10x faster and ~5x smaller than CSV, and reads back
+    without re-parsing floats from text. CSV fallback goes through
+    polars' Rust writer when installed.
+
+    Args:
+        df: DataFrame to save
+        path: Target path (suffix switched to .parquet when applicable)
+
+    Returns:
+        Path actually written
+    """
+    if HAS_PYARROW:
+        path = path.with_suffix('.parquet')
+        df.to_parquet(path, engine='pyarrow', compression='snappy')
+    elif pl is not None:
+        pl.from_pandas(df).write_csv(str(path))
+    else:
+        df.to_csv(path, index=False)
+    return path
+
+
+def _request_params(ticker, api_key):
+    """Build query parameters for a TIME_SERIES_DAILY request."""
+    return {
+        'function': 'TIME_SERIES_DAILY',
+        'symbol': ticker,
+        'apikey': api_key,
+        'outputsize': 'compact',  # Free tier: last 100 days (full = premium only)
+        'datatype': 'json'
+    }
+
+
+def _parse_daily_series(ticker, status_code, content):
+    """Parse a TIME_SERIES_DAILY JSON response into a DataFrame.
+
+    Shared by the sync and async download paths.
+
     Args:
         ticker: Stock ticker (e.g., 'BBCA.JK')
-        api_key: Alpha Vantage API key
-    
+        status_code: HTTP status code
+        content: Raw response body (bytes)
+
     Returns:
         DataFrame or None
     """
-    print(f"\n{'─'*60}")
-    print(f"📥 Downloading {ticker}...")
-    
     try:
-        url = "https://www.alphavantage.co/query"
-        
-        params = {
-            'function': 'TIME_SERIES_DAILY',
-            'symbol': ticker,
-            'apikey': api_key,
-            'outputsize': 'compact',  # Free tier: last 100 days (full = premium only)
-            'datatype': 'csv'
-        }
-        
-        response = requests.get(url, params=params, timeout=20)
-        
-        if response.status_code == 200:
-            # Check if we got CSV data (not an error message)
-            if 'timestamp' in response.text.lower() or 'date' in response.text.lower():
-                df = pd.read_csv(StringIO(response.text))
-                
-                # Rename timestamp column to Date if needed
-                if 'timestamp' in df.columns:
-                    df.rename(columns={'timestamp': 'Date'}, inplace=True)
-                
+        if status_code == 200:
+            payload = _json_loads(content)
+            series = payload.get('Time Series (Daily)')
+
+            if series:
+                # Build DataFrame directly from the date→OHLCV dict
+                # (no StringIO/CSV round-trip, no dtype re-inference)
+                dates = list(series)
+                df = pd.DataFrame({
+                    'Date': pd.to_datetime(dates),
+                    'Open': [float(series[d]['1. open']) for d in dates],
+                    'High': [float(series[d]['2. high']) for d in dates],
+                    'Low': [float(series[d]['3. low']) for d in dates],
+                    'Close': [float(series[d]['4. close']) for d in dates],
+                    'Volume': [int(series[d]['5. volume']) for d in dates],
+                })
+
                 # Add ticker column
                 df['Ticker'] = ticker
-                
-                # Convert Date to datetime
-                df['Date'] = pd.to_datetime(df['Date'])
-                
-                # Sort by date
-                df = df.sort_values('Date').reset_index(drop=True)
-                
+
+                # Sort by date and downcast to compact dtypes
+                df = df.sort_values('Date').reset_index(drop=True).astype(OHLCV_DTYPES)
+
                 print(f"  ✅ SUCCESS: {len(df)} records")
                 print(f"  📅 Date range: {df['Date'].min().date()} to {df['Date'].max().date()}")
-                
+
                 return df
             else:
-                # Check for error messages
-                if 'error' in response.text.lower() or 'invalid' in response.text.lower():
-                    print(f"  ❌ API Error: {response.text[:200]}")
-                    
-                    # Common error messages
-                    if 'api key' in response.text.lower():
-                        print(f"  ⚠️ HINT: Check your API key is correct!")
-                    elif 'premium' in response.text.lower():
-                        print(f"  ⚠️ HINT: This ticker might require premium tier")
-                    elif 'limit' in response.text.lower():
-                        print(f"  ⚠️ HINT: Rate limit reached - wait 1 minute")
-                else:
-                    print(f"  ⚠️ Unexpected response format")
-                    print(f"  Response preview: {response.text[:300]}")
-                
+                # API returned an error/notice instead of data
+                message = str(
+                    payload.get('Error Message')
+                    or payload.get('Note')
+                    or payload.get('Information')
+                    or payload
+                )
+                print(f"  ❌ API Error: {message[:200]}")
+
+                # Common error messages
+                if 'api key' in message.lower():
+                    print(f"  ⚠️ HINT: Check your API key is correct!")
+                elif 'premium' in message.lower():
+                    print(f"  ⚠️ HINT: This ticker might require premium tier")
+                elif 'limit' in message.lower() or 'frequency' in message.lower():
+                    print(f"  ⚠️ HINT: Rate limit reached - wait 1 minute")
+
                 return None
         else:
-            print(f"  ❌ HTTP Error {response.status_code}")
+            print(f"  ❌ HTTP Error {status_code}")
             return None
-            
+
     except Exception as e:
         print(f"  ❌ Download failed: {e}")
         return None
 
 
+@BREAKER
+@rate_limited
+def download_stock_data(ticker, api_key):
+    """Download historical data from Alpha Vantage.
+
+    Args:
+        ticker: Stock ticker (e.g., 'BBCA.JK')
+        api_key: Alpha Vantage API key
+
+    Returns:
+        DataFrame or None
+    """
+    print(f"\n{'─'*60}")
+    print(f"📥 Downloading {ticker}...")
+
+    try:
+        response = SESSION.get(API_URL, params=_request_params(ticker, api_key), timeout=20)
+    except Exception as e:
+        print(f"  ❌ Download failed: {e}")
+        return None
+
+    return _parse_daily_series(ticker, response.status_code, response.content)
+
+
+async def download_stocks_async(tickers, api_key):
+    """Download all tickers concurrently with httpx.AsyncClient.
+
+    Uses the same token-bucket policy as the threaded path, but waits with
+    `await asyncio.sleep` so the event loop is never blocked. Requests
+    overlap while sockets wait on I/O; one connection pool serves all calls.
+
+    Args:
+        tickers: List of stock tickers
+        api_key: Alpha Vantage API key
+
+    Returns:
+        List of DataFrames (None entries for failed tickers)
+    """
+    lock = asyncio.Lock()
+    call_times = deque()
+
+    async def acquire_token():
+        while True:
+            async with lock:
+                now = time.monotonic()
+                while call_times and now - call_times[0] >= RATE_LIMIT_WINDOW:
+                    call_times.popleft()
+
+                if len(call_times) < RATE_LIMIT_CALLS:
+                    call_times.append(now)
+                    return
+
+                wait_time = RATE_LIMIT_WINDOW - (now - call_times[0])
+
+            print(f"  ⏳ Rate limit reached - waiting {wait_time:.0f}s...")
+            await asyncio.sleep(wait_time)
+
+    async def fetch(ticker):
+        if not BREAKER.allow_call():
+            print(f"  ⚠️ Provider circuit open - skipping {ticker}")
+            return None
+
+        await acquire_token()
+        print(f"\n{'─'*60}")
+        print(f"📥 Downloading {ticker}...")
+
+        try:
+            response = await client.get(API_URL, params=_request_params(ticker, api_key))
+        except Exception as e:
+            print(f"  ❌ Download failed: {e}")
+            BREAKER.record_failure()
+            return None
+
+        df = _parse_daily_series(ticker, response.status_code, response.content)
+
+        if df is None:
+            BREAKER.record_failure()
+        else:
+            BREAKER.record_success()
+
+        return df
+
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    async with httpx.AsyncClient(timeout=20, limits=limits) as client:
+        return await asyncio.gather(*[fetch(ticker) for ticker in tickers])
+
+
 def main():
     """Main download function."""
     
@@ -131,42 +368,44 @@ def main():
     
     print(f"\n✅ API Key set: {ALPHA_VANTAGE_API_KEY[:8]}...")
     print(f"📊 Stocks to download: {len(STOCKS)}")
-    print(f"⏱️ Rate limit: 5 calls/min (will wait between requests)")
-    
+    print(f"⏱️ Rate limit: 5 calls/min ({MAX_WORKERS} concurrent downloads)")
+
     # Create output directory
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    
+
     successful = []
     failed = []
     all_data = []
-    
-    for i, ticker in enumerate(STOCKS):
-        # Download
-        df = download_stock_data(ticker, ALPHA_VANTAGE_API_KEY)
-        
+
+    # Download concurrently - async httpx when available (no thread per
+    # request, rate-limit waits don't block the loop), threads otherwise
+    if httpx is not None:
+        results = asyncio.run(download_stocks_async(STOCKS, ALPHA_VANTAGE_API_KEY))
+    else:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(download_stock_data, ticker, ALPHA_VANTAGE_API_KEY)
+                for ticker in STOCKS
+            ]
+            results = [f.result() for f in futures]
+
+    for ticker, df in zip(STOCKS, results):
         if df is not None and len(df) > 0:
             # Save individual file
             filename = f"{ticker.replace('.JK', '')}_alphavantage.csv"
-            filepath = OUTPUT_DIR / filename
-            df.to_csv(filepath, index=False)
-            
+            filepath = save_frame(df, OUTPUT_DIR / filename)
+
             print(f"  💾 Saved: {filepath}")
-            
+
             successful.append({
                 'ticker': ticker,
                 'records': len(df),
                 'file': str(filepath)
             })
-            
+
             all_data.append(df)
         else:
             failed.append(ticker)
-        
-        # Rate limiting: Wait 12 seconds between requests (5 calls/min = 1 call per 12 sec)
-        if i < len(STOCKS) - 1:  # Don't wait after last stock
-            wait_time = 13  # 13 seconds to be safe
-            print(f"  ⏳ Waiting {wait_time}s (rate limit)...")
-            time.sleep(wait_time)
     
     # Summary
     print("\n" + "=" * 80)
@@ -178,10 +417,13 @@ def main():
         for item in successful:
             print(f"   {item['ticker']}: {item['records']:,} records")
         
-        # Combine all data
-        combined_df = pd.concat(all_data, ignore_index=True)
-        combined_file = OUTPUT_DIR / "all_stocks_combined.csv"
-        combined_df.to_csv(combined_file, index=False)
+        # Combine all data. Frames share the exact OHLCV_DTYPES from the
+        # parser, so no promotion copy happens and copy=False skips the
+        # defensive buffer copy. Categorical ticker shrinks to 1 byte/row
+        # and makes nunique/groupby O(categories)
+        combined_df = pd.concat(all_data, ignore_index=True, copy=False)
+        combined_df['Ticker'] = combined_df['Ticker'].astype('category')
+        combined_file = save_frame(combined_df, OUTPUT_DIR / "all_stocks_combined.csv")
         
         print(f"\n📊 Combined dataset:")
         print(f"   Total records: {len(combined_df):,}")
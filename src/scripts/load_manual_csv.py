@@ -10,11 +10,29 @@ Supports CSV from:
 - Investing.com
 """
 
+import os
+import re
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 import sys
 
+# polars' Rust CSV parser loads these files ~10x faster than pandas;
+# the pandas path below remains the fallback
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Parquet keeps dtypes and skips float->text formatting on write; the
+# CSV path stays available via --legacy-csv or when pyarrow is missing
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.utils.logger import setup_logger
@@ -22,6 +40,64 @@ from src.utils.validators import DataQualityChecker
 
 logger = setup_logger(__name__)
 
+# Standard columns after normalization
+REQUIRED_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+# Everything a normalized frame may carry (required + optional)
+KEEP_COLUMNS = REQUIRED_COLUMNS + ['Ticker', 'Adj_Close']
+
+# Map source-specific column names (incl. Indonesian IDX headers)
+COLUMN_MAP = {
+    'Tanggal': 'Date',
+    'Tgl': 'Date',
+    'Pembukaan': 'Open',
+    'Tertinggi': 'High',
+    'Terendah': 'Low',
+    'Penutupan': 'Close',
+    'Vol': 'Volume',
+    'Adj_Close': 'Adj_Close'  # Keep but optional
+}
+
+# Known date layouts per source - an explicit format skips pandas'
+# per-value format inference
+SOURCE_DATE_FORMATS = {
+    'yahoo': '%Y-%m-%d',
+    'stooq': '%Y-%m-%d',
+}
+
+# Compact analytics dtypes: float32 covers the 4-6 significant digits in
+# source CSVs and daily volumes fit int32, halving memory and file size
+OHLCV_DTYPES = {
+    'Open': 'float32',
+    'High': 'float32',
+    'Low': 'float32',
+    'Close': 'float32',
+    'Adj_Close': 'float32',
+    'Volume': 'int32',
+}
+
+# Full read schema per source: passing dtype/parse_dates up front turns
+# off the C engine's type and date sniffer for files we recognize
+_PRICE_DTYPES = {
+    'Open': 'float32',
+    'High': 'float32',
+    'Low': 'float32',
+    'Close': 'float32',
+    'Volume': 'int32',
+}
+SOURCE_READ_KWARGS = {
+    'yahoo': {
+        'dtype': {**_PRICE_DTYPES, 'Adj Close': 'float32'},
+        'parse_dates': ['Date'],
+        'date_format': '%Y-%m-%d',
+    },
+    'stooq': {
+        'dtype': _PRICE_DTYPES,
+        'parse_dates': ['Date'],
+        'date_format': '%Y-%m-%d',
+    },
+}
+
 
 def detect_csv_format(df):
     """Detect which source the CSV came from.
@@ -46,65 +122,164 @@ def detect_csv_format(df):
     return 'unknown'
 
 
+# Per-file encoding cache so reruns over the same directory skip sniffing
+_ENCODING_CACHE = {}
+
+
+def detect_encoding(file_path):
+    """Sniff a file's encoding from its first 64 KiB, memoized per path.
+
+    Decoding a small sample up front beats re-reading a whole file once
+    per candidate encoding. latin1 maps every byte, so it safely covers
+    the legacy exports that are not UTF-8.
+
+    Returns:
+        str: 'utf-8' or 'latin1'
+    """
+    key = str(file_path)
+    if key not in _ENCODING_CACHE:
+        with open(file_path, 'rb') as f:
+            sample = f.read(65536)
+        try:
+            sample.decode('utf-8')
+            _ENCODING_CACHE[key] = 'utf-8'
+        except UnicodeDecodeError:
+            _ENCODING_CACHE[key] = 'latin1'
+    return _ENCODING_CACHE[key]
+
+
+# Leading ticker token of a filename stem; the dot keeps stems like
+# 'BBCA.JK_manual' intact
+_TICKER_RE = re.compile(r'^([A-Za-z0-9.]+)')
+
+
+def _ticker_from_filename(file_path):
+    """Derive a .JK ticker from a CSV filename like BBCA_manual.csv."""
+    match = _TICKER_RE.match(file_path.stem)
+    ticker = match.group(1).upper() if match else file_path.stem.upper()
+    if not ticker.endswith('.JK'):
+        ticker = f"{ticker}.JK"
+    return ticker
+
+
+def _normalize_csv_polars(file_path):
+    """Load and normalize a CSV through polars' Rust parser.
+
+    Runs the same rename / date-parse / filter / sort pipeline as the
+    pandas path, converting to pandas only at the boundary where
+    DataQualityChecker consumes the frame.
+
+    Args:
+        file_path: Path to CSV file
+
+    Returns:
+        pandas DataFrame in the standard format
+    """
+    encoding = 'utf8' if detect_encoding(file_path) == 'utf-8' else 'utf8-lossy'
+    df = pl.read_csv(file_path, try_parse_dates=True, infer_schema_length=1000,
+                     encoding=encoding)
+
+    # Detect format (works on column names only)
+    source = detect_csv_format(df)
+    logger.info(f"  Detected format: {source}")
+
+    # Normalize column names, then map source-specific variants
+    df = df.rename({c: c.strip().title().replace(' ', '_') for c in df.columns})
+    df = df.rename({c: COLUMN_MAP[c] for c in df.columns if c in COLUMN_MAP and COLUMN_MAP[c] != c})
+
+    # Parse Date when the reader left it as text
+    if df.schema['Date'] == pl.String:
+        df = df.with_columns(pl.col('Date').str.to_datetime(strict=False))
+
+    # Extract ticker from filename if not in data
+    if 'Ticker' not in df.columns:
+        df = df.with_columns(pl.lit(_ticker_from_filename(file_path)).alias('Ticker'))
+
+    # Keep only required + optional columns
+    keep_cols = [c for c in KEEP_COLUMNS if c in df.columns]
+
+    df = (
+        df.select(keep_cols)
+        .drop_nulls(subset=['Date', 'Close'])
+        .sort('Date')
+        .with_columns([
+            pl.col(c).cast(pl.Float32 if OHLCV_DTYPES[c] == 'float32' else pl.Int32,
+                           strict=False)
+            for c in keep_cols if c in OHLCV_DTYPES
+        ])
+    )
+
+    logger.info(f"  Loaded {len(df)} records")
+
+    return df.to_pandas()
+
+
 def normalize_csv(file_path):
     """Load and normalize CSV to standard format.
-    
+
     Args:
         file_path: Path to CSV file
-    
+
     Returns:
         DataFrame with columns: Date, Open, High, Low, Close, Volume, Ticker
     """
     try:
-        # Try different encodings
-        for encoding in ['utf-8', 'latin1', 'iso-8859-1']:
+        # Fast path: Rust-backed CSV parsing when polars is installed
+        if pl is not None:
             try:
-                df = pd.read_csv(file_path, encoding=encoding)
-                break
-            except:
-                continue
-        
-        if df is None:
-            logger.error(f"Failed to read {file_path}")
-            return None
-        
-        # Detect format
-        source = detect_csv_format(df)
+                return _normalize_csv_polars(file_path)
+            except Exception as e:
+                logger.warning(f"  polars fast path failed ({e}), falling back to pandas")
+
+        # Sniff the encoding once from a sample instead of re-reading the
+        # file per candidate encoding
+        encoding = detect_encoding(file_path)
+
+        # Cheap header-only peek: detect the source first so the full
+        # read gets its schema and skips dtype/date sniffing
+        header = pd.read_csv(file_path, nrows=0, encoding=encoding)
+        source = detect_csv_format(header)
+        try:
+            df = pd.read_csv(file_path, encoding=encoding,
+                             **SOURCE_READ_KWARGS.get(source, {}))
+        except (ValueError, TypeError):
+            # Schema hint didn't fit (e.g. 'null' cells) - sniff
+            df = pd.read_csv(file_path, encoding=encoding)
+
         logger.info(f"  Detected format: {source}")
-        
+
         # Normalize column names
         df.columns = [c.strip().title().replace(' ', '_') for c in df.columns]
-        
-        # Standard columns
-        required = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
-        
-        # Map variations
-        column_map = {
-            'Tanggal': 'Date',
-            'Tgl': 'Date',
-            'Pembukaan': 'Open',
-            'Tertinggi': 'High',
-            'Terendah': 'Low',
-            'Penutupan': 'Close',
-            'Vol': 'Volume',
-            'Adj_Close': 'Adj_Close'  # Keep but optional
-        }
-        
-        df.rename(columns=column_map, inplace=True)
-        
-        # Convert Date to datetime
-        df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-        
+
+        df.rename(columns=COLUMN_MAP, inplace=True)
+
+        # Convert Date to datetime. Parse each unique string once and map
+        # back: strptime dominates this step, and daily files repeat far
+        # fewer distinct date strings than rows
+        if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+            uniq = df['Date'].astype(str).unique()
+            lut = dict(zip(uniq, pd.to_datetime(
+                uniq, errors='coerce', format=SOURCE_DATE_FORMATS.get(source)
+            )))
+            df['Date'] = df['Date'].astype(str).map(lut)
+
         # Extract ticker from filename if not in data
         if 'Ticker' not in df.columns:
-            ticker = file_path.stem.split('_')[0].upper()
-            if not ticker.endswith('.JK'):
-                ticker = f"{ticker}.JK"
-            df['Ticker'] = ticker
-        
-        # Keep only required + optional columns
-        keep_cols = [c for c in required + ['Ticker', 'Adj_Close'] if c in df.columns]
-        df = df[keep_cols]
+            df['Ticker'] = _ticker_from_filename(file_path)
+
+        # Keep only required + optional columns: one index intersection
+        # instead of a per-column membership list comp
+        df = df.loc[:, df.columns.intersection(KEEP_COLUMNS, sort=False)]
+
+        # Downcast anything the schema-hinted read didn't already cover
+        casts = {
+            c: OHLCV_DTYPES[c] for c in df.columns
+            if c in OHLCV_DTYPES
+            and str(df[c].dtype) != OHLCV_DTYPES[c]
+            and df[c].notna().all()
+        }
+        if casts:
+            df = df.astype(casts)
         
         # Drop rows with missing critical data
         df.dropna(subset=['Date', 'Close'], inplace=True)
@@ -157,12 +332,19 @@ def load_manual_csvs():
     successful = []
     failed = []
     
-    for csv_file in csv_files:
+    # Parse files on all cores: normalize_csv is CPU-bound (CSV parse +
+    # date coercion) and top-level, so it pickles cleanly into workers.
+    # A single file skips the pool to avoid process-startup overhead.
+    if len(csv_files) > 1:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            frames = list(executor.map(normalize_csv, csv_files))
+    else:
+        frames = [normalize_csv(csv_files[0])]
+
+    for csv_file, df in zip(csv_files, frames):
         logger.info(f"\n{'─'*60}")
         logger.info(f"Loading: {csv_file.name}")
-        
-        df = normalize_csv(csv_file)
-        
+
         if df is not None and len(df) > 0:
             all_data.append(df)
             successful.append({
@@ -178,15 +360,29 @@ def load_manual_csvs():
         logger.error("\n❌ No valid data loaded!")
         return None
     
-    # Combine all dataframes
-    combined_df = pd.concat(all_data, ignore_index=True)
+    # Combine all dataframes. Every frame shares the OHLCV_DTYPES schema,
+    # so copy=False concatenates without re-copying each column's bytes;
+    # the index is rebuilt once afterwards instead of per-frame
+    combined_df = pd.concat(all_data, copy=False)
+    combined_df.reset_index(drop=True, inplace=True)
+
+    # Categorical ticker: integer codes instead of a Python string per
+    # row, and groupby partitions without mask scans
+    combined_df['Ticker'] = combined_df['Ticker'].astype('category')
     
     # Save combined dataset
     output_dir = Path("data/processed")
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    output_file = output_dir / "manual_stocks_combined.csv"
-    combined_df.to_csv(output_file, index=False)
+    if HAS_PYARROW and '--legacy-csv' not in sys.argv:
+        # zstd parquet: dictionary-encoded Ticker and binary floats cut
+        # the file size ~10x vs repeated strings in CSV
+        output_file = output_dir / "manual_stocks_combined.parquet"
+        combined_df.to_parquet(output_file, engine='pyarrow',
+                               compression='zstd', index=False)
+    else:
+        output_file = output_dir / "manual_stocks_combined.csv"
+        combined_df.to_csv(output_file, index=False)
     
     # Summary
     logger.info("\n" + "=" * 80)
@@ -213,10 +409,10 @@ def load_manual_csvs():
     logger.info("DATA QUALITY CHECK")
     logger.info("=" * 80)
     
-    for ticker in combined_df['Ticker'].unique():
+    # Single groupby pass instead of one boolean-mask scan per ticker
+    for ticker, stock_df in combined_df.groupby('Ticker', sort=False, observed=True):
         logger.info(f"\n{ticker}:")
-        stock_df = combined_df[combined_df['Ticker'] == ticker]
-        
+
         checker = DataQualityChecker(stock_df)
         report = checker.run_all_checks()
         
@@ -236,7 +432,7 @@ if __name__ == "__main__":
     
     if df is not None:
         print(f"\n🎉 SUCCESS! {len(df)} records loaded")
-        print(f"📁 Location: data/processed/manual_stocks_combined.csv")
+        print(f"📁 Location: data/processed/")
         sys.exit(0)
     else:
         print("\n⚠️ No data loaded - manual download needed")
@@ -5,10 +5,11 @@ with different model configurations. Use this to verify MLflow setup.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 import numpy as np
 from sklearn.ensemble import IsolationForest
-from sklearn.metrics import precision_score, recall_score, f1_score, confusion_matrix
+from sklearn.metrics import confusion_matrix
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -19,36 +20,45 @@ from src.utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+@lru_cache(maxsize=8)
 def generate_sample_data(n_samples=1000, contamination=0.05):
     """Generate synthetic anomaly detection data.
-    
+
+    Memoized on (n_samples, contamination): configs that share a
+    contamination level reuse the same arrays instead of regenerating
+    them. The returned arrays are read-only so cached data can't be
+    mutated by one experiment and leak into the next.
+
     Args:
         n_samples: Number of samples
         contamination: Proportion of anomalies
-    
+
     Returns:
-        X: Feature matrix
-        y: True labels (1=normal, -1=anomaly)
+        X: Feature matrix (read-only)
+        y: True labels (1=normal, -1=anomaly, read-only)
     """
     np.random.seed(42)
-    
-    # Normal data
+
     n_normal = int(n_samples * (1 - contamination))
-    X_normal = np.random.randn(n_normal, 6) * 0.5
-    
-    # Anomalous data (outliers)
     n_anomaly = n_samples - n_normal
-    X_anomaly = np.random.randn(n_anomaly, 6) * 3.0 + 5
-    
-    # Combine
-    X = np.vstack([X_normal, X_anomaly])
-    y = np.hstack([np.ones(n_normal), -np.ones(n_anomaly)])
-    
-    # Shuffle
-    indices = np.random.permutation(n_samples)
-    X = X[indices]
-    y = y[indices]
-    
+
+    # Fill normal and anomaly blocks straight into one preallocated
+    # float32 buffer: no vstack copy, half the bytes of float64
+    X = np.empty((n_samples, 6), dtype=np.float32)
+    X[:n_normal] = np.random.randn(n_normal, 6) * 0.5
+    X[n_normal:] = np.random.randn(n_anomaly, 6) * 3.0 + 5
+
+    y = np.empty(n_samples, dtype=np.float32)
+    y[:n_normal] = 1
+    y[n_normal:] = -1
+
+    # No shuffle: IsolationForest subsamples internally (max_samples),
+    # so row order doesn't affect the fit, and the fancy-indexed copy
+    # of X was pure allocation churn
+
+    X.setflags(write=False)
+    y.setflags(write=False)
+
     return X, y
 
 
@@ -70,11 +80,14 @@ def run_experiment(contamination, n_estimators, max_samples):
     X_test, y_test = generate_sample_data(300, contamination=contamination)
     
     # Train model
+    # n_jobs=-1: tree building is embarrassingly parallel and sklearn's
+    # joblib path stays deterministic under a fixed random_state
     model = IsolationForest(
         contamination=contamination,
         n_estimators=n_estimators,
         max_samples=max_samples,
-        random_state=42
+        random_state=42,
+        n_jobs=-1
     )
     model.fit(X_train)
     
@@ -86,22 +99,26 @@ def run_experiment(contamination, n_estimators, max_samples):
     y_test_binary = (y_test == 1).astype(int)
     y_pred_binary = (y_pred == 1).astype(int)
     
+    # One confusion-matrix pass over the label arrays; precision/recall/F1
+    # fall out of the counts without three extra sklearn scorer scans
+    cm = confusion_matrix(y_test_binary, y_pred_binary, labels=[0, 1])
+    tn, fp, fn, tp = cm.ravel()
+
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+
     metrics = {
-        'precision': float(precision_score(y_test_binary, y_pred_binary, zero_division=0)),
-        'recall': float(recall_score(y_test_binary, y_pred_binary, zero_division=0)),
-        'f1_score': float(f1_score(y_test_binary, y_pred_binary, zero_division=0)),
+        'precision': float(precision),
+        'recall': float(recall),
+        'f1_score': float(f1),
+        'true_positives': int(tp),
+        'false_positives': int(fp),
+        'true_negatives': int(tn),
+        'false_negatives': int(fn),
+        'false_positive_rate': float(fp / (fp + tn)) if (fp + tn) > 0 else 0.0,
     }
     
-    # Calculate anomaly-specific metrics
-    cm = confusion_matrix(y_test_binary, y_pred_binary)
-    if cm.size == 4:
-        tn, fp, fn, tp = cm.ravel()
-        metrics['true_positives'] = int(tp)
-        metrics['false_positives'] = int(fp)
-        metrics['true_negatives'] = int(tn)
-        metrics['false_negatives'] = int(fn)
-        metrics['false_positive_rate'] = float(fp / (fp + tn)) if (fp + tn) > 0 else 0.0
-    
     logger.info(f"Results: F1={metrics['f1_score']:.3f}, Precision={metrics['precision']:.3f}")
     
     return model, metrics, y_test, y_pred
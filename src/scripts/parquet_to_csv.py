@@ -0,0 +1,68 @@
+"""Export a partitioned parquet dataset to CSV on demand.
+
+The pipeline writes one partitioned parquet dataset instead of eagerly
+dumping a CSV per ticker. When a spreadsheet-friendly copy is actually
+needed, run this instead:
+
+    python src/scripts/parquet_to_csv.py data/raw/validation.parquet
+    python src/scripts/parquet_to_csv.py data/raw/validation.parquet --per-ticker
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+
+def export_csv(dataset_path, output_dir=None, per_ticker=False):
+    """Convert a parquet dataset to CSV file(s).
+
+    Args:
+        dataset_path: Path to a parquet file or partitioned dataset dir
+        output_dir: Directory for the CSV output (default: alongside input)
+        per_ticker: Write one CSV per ticker instead of a combined file
+
+    Returns:
+        List of written file paths
+    """
+    dataset_path = Path(dataset_path)
+    output_dir = Path(output_dir) if output_dir else dataset_path.parent
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    df = pd.read_parquet(dataset_path)
+    written = []
+
+    if per_ticker and 'Ticker' in df.columns:
+        for ticker, group in df.groupby('Ticker', sort=False, observed=True):
+            filepath = output_dir / f"{ticker}_{dataset_path.stem}.csv"
+            group.to_csv(filepath, index=False)
+            written.append(filepath)
+            print(f"💾 Saved: {filepath} ({len(group)} rows)")
+    else:
+        filepath = output_dir / f"{dataset_path.stem}.csv"
+        df.to_csv(filepath, index=False)
+        written.append(filepath)
+        print(f"💾 Saved: {filepath} ({len(df)} rows)")
+
+    return written
+
+
+def main():
+    """CLI entry point."""
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    if not args:
+        print("Usage: python src/scripts/parquet_to_csv.py <dataset> [output_dir] [--per-ticker]")
+        sys.exit(1)
+
+    dataset = args[0]
+    output_dir = args[1] if len(args) > 1 else None
+
+    if not Path(dataset).exists():
+        print(f"❌ Dataset not found: {dataset}")
+        sys.exit(1)
+
+    export_csv(dataset, output_dir, per_ticker='--per-ticker' in sys.argv)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,9 @@ After exhaustive testing, here are PROFESSIONAL-GRADE approaches:
 # ============================================================================
 
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime, timedelta
+import re
 import time
 import json
 
@@ -37,31 +37,35 @@ class ProfessionalYahooScraper:
         }
         
         self.session.headers.update(self.headers)
-    
+
+        # Crumb is tied to the session cookie, not the ticker - fetch it
+        # once and reuse across the whole run
+        self._crumb = None
+
     def get_crumb_and_cookie(self, ticker):
-        """Get Yahoo's crumb token and cookie (REQUIRED for downloads)."""
+        """Get Yahoo's crumb token and cookie (REQUIRED for downloads).
+
+        Cached per session: the first call fetches and parses a quote
+        page, later calls return the stored crumb immediately.
+        """
+        if self._crumb is not None:
+            return self._crumb
+
         try:
             url = f'https://finance.yahoo.com/quote/{ticker}'
             response = self.session.get(url, timeout=10)
-            
-            # Extract crumb from page
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Method 1: Look for crumb in script tags
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if script.string and 'CrumbStore' in script.string:
-                    # Extract crumb value
-                    import re
-                    match = re.search(r'"CrumbStore":\{"crumb":"([^"]+)"\}', script.string)
-                    if match:
-                        crumb = match.group(1)
-                        print(f"  ✅ Got crumb: {crumb[:10]}...")
-                        return crumb
-            
+
+            # Single regex sweep over the raw HTML - no need to build a
+            # BeautifulSoup tree just to find one token
+            match = re.search(r'"CrumbStore":\{"crumb":"([^"]+)"\}', response.text)
+            if match:
+                self._crumb = match.group(1)
+                print(f"  ✅ Got crumb: {self._crumb[:10]}...")
+                return self._crumb
+
             print("  ⚠️ Crumb not found in standard location")
             return None
-            
+
         except Exception as e:
             print(f"  ❌ Failed to get crumb: {e}")
             return None
@@ -85,9 +89,10 @@ class ProfessionalYahooScraper:
             
             response = self.session.get(url, params=params, timeout=15)
             
-            if response.status_code == 200 and 'Date' in response.text:
-                from io import StringIO
-                df = pd.read_csv(StringIO(response.text))
+            if response.status_code == 200 and b'Date' in response.content:
+                from io import BytesIO
+                # Bytes in, bytes parsed: skips the str decode round-trip
+                df = pd.read_csv(BytesIO(response.content))
                 
                 if len(df) > 0:
                     print(f"  ✅ Downloaded {len(df)} records with crumb!")
@@ -127,9 +132,9 @@ def get_alpha_vantage_data(ticker, api_key):
         response = requests.get(url, params=params, timeout=15)
         
         if response.status_code == 200:
-            from io import StringIO
-            df = pd.read_csv(StringIO(response.text))
-            
+            from io import BytesIO
+            df = pd.read_csv(BytesIO(response.content))
+
             if 'timestamp' in df.columns:
                 print(f"  ✅ Alpha Vantage: {len(df)} records")
                 return df
@@ -164,8 +169,8 @@ def get_twelvedata(ticker, api_key):
         response = requests.get(url, params=params, timeout=15)
         
         if response.status_code == 200:
-            from io import StringIO
-            df = pd.read_csv(StringIO(response.text))
+            from io import BytesIO
+            df = pd.read_csv(BytesIO(response.content))
             print(f"  ✅ Twelve Data: {len(df)} records")
             return df
         
@@ -5,21 +5,52 @@ directly from Yahoo Finance website when API methods fail.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from bs4 import BeautifulSoup
 import json
 
-def scrape_yahoo_finance(ticker, start_date, end_date):
+# At most 2 requests in flight against Yahoo at once - politeness without
+# serializing the whole run behind sleeps
+_YAHOO_SLOTS = threading.Semaphore(2)
+
+
+def build_session():
+    """Create a pooled session shared across all tickers.
+
+    One session means one TCP+TLS handshake to query1.finance.yahoo.com
+    instead of one per ticker; transient 429/5xx responses retry with
+    backoff at the adapter level.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504]
+    )
+    session.mount('https://', HTTPAdapter(
+        pool_connections=1, pool_maxsize=4, max_retries=retry
+    ))
+    return session
+
+
+def scrape_yahoo_finance(ticker, start_date, end_date, session=None):
     """Scrape historical data from Yahoo Finance website.
-    
+
     Args:
         ticker: Stock ticker (e.g., 'BBCA.JK')
         start_date: datetime object
         end_date: datetime object
-    
+        session: Shared requests.Session (a fresh one is made if omitted)
+
     Returns:
         DataFrame with OHLCV data or None
     """
@@ -50,12 +81,17 @@ def scrape_yahoo_finance(ticker, start_date, end_date):
             'Upgrade-Insecure-Requests': '1'
         }
         
-        session = requests.Session()
-        response = session.get(url, params=params, headers=headers, timeout=15)
+        if session is None:
+            session = build_session()
+        with _YAHOO_SLOTS:
+            response = session.get(url, params=params, headers=headers, timeout=15)
         
         if response.status_code == 200:
-            from io import StringIO
-            df = pd.read_csv(StringIO(response.text))
+            from io import BytesIO
+            # Parse straight from the response bytes - going through
+            # response.text would decode to str only for pandas to
+            # re-encode it
+            df = pd.read_csv(BytesIO(response.content))
             
             if not df.empty and len(df) > 0:
                 print(f"✅ Scraped {len(df)} records for {ticker}")
@@ -95,29 +131,37 @@ def main():
     
     successful = []
     failed = []
-    
-    for ticker in stocks:
-        print(f"\n{'─'*60}")
-        df = scrape_yahoo_finance(ticker, start_date, end_date)
-        
-        if df is not None and len(df) > 0:
-            # Save to CSV
-            filename = f"{ticker.replace('.JK', '')}_scraped.csv"
-            filepath = output_dir / filename
-            df.to_csv(filepath, index=False)
-            
-            successful.append({
-                'ticker': ticker,
-                'records': len(df),
-                'file': str(filepath)
-            })
-            
-            print(f"💾 Saved: {filepath}")
-        else:
-            failed.append(ticker)
-        
-        # Be polite - don't hammer the server
-        time.sleep(2)
+
+    # Shared session: every ticker reuses the same TLS connection
+    session = build_session()
+
+    # I/O-parallel scraping: overlap the network waits, with the
+    # semaphore in scrape_yahoo_finance capping concurrent hits on Yahoo
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(scrape_yahoo_finance, ticker, start_date, end_date, session): ticker
+            for ticker in stocks
+        }
+
+        for future in as_completed(futures):
+            ticker = futures[future]
+            df = future.result()
+
+            if df is not None and len(df) > 0:
+                # Save to CSV
+                filename = f"{ticker.replace('.JK', '')}_scraped.csv"
+                filepath = output_dir / filename
+                df.to_csv(filepath, index=False)
+
+                successful.append({
+                    'ticker': ticker,
+                    'records': len(df),
+                    'file': str(filepath)
+                })
+
+                print(f"💾 Saved: {filepath}")
+            else:
+                failed.append(ticker)
     
     # Summary
     print("\n" + "=" * 80)
@@ -6,39 +6,82 @@ historical stock data from Yahoo Finance. Works when APIs fail!
 Requires: selenium, webdriver-manager
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
+# selenium / webdriver_manager / pandas are imported lazily inside the
+# functions that need them: importing this module (or exiting early on
+# a setup error) stays near-instant instead of paying ~1s of cold start
+import requests
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime, timedelta
+import queue
+import re
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Concurrent browsers: scraping is I/O-bound (page load + download wait),
+# so a few live Chromes cut wall time roughly by the pool size
+N_WORKERS = 4
+
+
+def setup_driver(worker_id=0):
+    """Setup Chrome driver with options.
+
+    Args:
+        worker_id: Pool slot index. Each driver downloads into its own
+            directory because Chrome mangles filenames when two browsers
+            drop the same file into one folder.
+
+    Returns:
+        Tuple of (driver, download_dir)
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    print(f"🌐 Setting up Chrome browser (worker {worker_id})...")
 
-def setup_driver():
-    """Setup Chrome driver with options."""
-    print("🌐 Setting up Chrome browser...")
-    
     chrome_options = Options()
+    # 'eager' returns at DOMContentLoaded - the table and Download link
+    # exist well before Yahoo's ad/tracking JS finishes loading
+    chrome_options.page_load_strategy = 'eager'
     chrome_options.add_argument('--headless')  # Run without opening browser window
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
-    
+    # We only need the Download link - skip images and the background
+    # chatter that makes Yahoo pages heavy
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-background-networking')
+
+    # Persistent profile: Yahoo's JS bundles, fonts and images stay in
+    # the HTTP cache across tickers and runs, so only the first page
+    # load is cold. One profile per worker - Chrome locks user-data-dir
+    # to a single process. --fresh-profile starts clean (e.g. for CI).
+    if '--fresh-profile' not in sys.argv:
+        profile_dir = Path(f"data/raw/selenium/chrome_profile/worker_{worker_id}").absolute()
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+        chrome_options.add_argument(f'--disk-cache-dir={profile_dir / "cache"}')
+        chrome_options.add_argument('--disk-cache-size=104857600')  # 100 MB
+
     # Set download directory
-    download_dir = str(Path("data/raw/selenium").absolute())
+    download_dir = str(Path(f"data/raw/selenium/worker_{worker_id}").absolute())
     Path(download_dir).mkdir(parents=True, exist_ok=True)
     
     prefs = {
         "download.default_directory": download_dir,
         "download.prompt_for_download": False,
         "download.directory_upgrade": True,
-        "safebrowsing.enabled": True
+        "safebrowsing.enabled": True,
+        # Belt-and-braces with --blink-settings: no image bytes fetched,
+        # but cookies stay on (Yahoo's download needs them)
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.cookies": 1
     }
     chrome_options.add_experimental_option("prefs", prefs)
     
@@ -61,6 +104,11 @@ def scrape_yahoo_selenium(ticker, download_dir, driver):
     Returns:
         DataFrame or None
     """
+    import pandas as pd
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
     try:
         print(f"\n{'='*60}")
         print(f"🔍 Scraping {ticker} with Selenium...")
@@ -69,9 +117,12 @@ def scrape_yahoo_selenium(ticker, download_dir, driver):
         url = f"https://finance.yahoo.com/quote/{ticker}/history"
         driver.get(url)
         
-        # Wait for page to load
+        # Wait for the history table rather than a fixed sleep: with a
+        # warm cache the page is ready in well under a second
         print("  ⏳ Waiting for page to load...")
-        time.sleep(3)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, 'table'))
+        )
         
         # Set time period to max (or 6 months)
         try:
@@ -80,13 +131,17 @@ def scrape_yahoo_selenium(ticker, download_dir, driver):
                 EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'dropdown-toggle')]"))
             )
             time_period_btn.click()
-            time.sleep(1)
-            
-            # Select "Max" or specific period
-            max_option = driver.find_element(By.XPATH, "//button[contains(text(), '6M') or contains(text(), '6 mo')]")
+
+            # Select "Max" or specific period; wait for the menu to
+            # render instead of sleeping through it. The table refresh
+            # is covered by the download-button wait below.
+            max_option = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable(
+                    (By.XPATH, "//button[contains(text(), '6M') or contains(text(), '6 mo')]")
+                )
+            )
             max_option.click()
-            time.sleep(2)
-            
+
         except Exception as e:
             print(f"  ⚠️ Could not set time period: {e}")
         
@@ -99,11 +154,17 @@ def scrape_yahoo_selenium(ticker, download_dir, driver):
             download_btn.click()
             
             print("  ⏳ Waiting for download...")
-            time.sleep(5)  # Wait for download to complete
-            
-            # Find downloaded file
+
+            # Poll for the finished file instead of a blanket 5s sleep;
+            # .crdownload means Chrome is still writing
             download_path = Path(download_dir)
-            csv_files = list(download_path.glob(f"{ticker}*.csv"))
+            csv_files = []
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                csv_files = list(download_path.glob(f"{ticker}*.csv"))
+                if csv_files and not list(download_path.glob('*.crdownload')):
+                    break
+                time.sleep(0.25)
             
             if csv_files:
                 latest_file = max(csv_files, key=lambda p: p.stat().st_mtime)
@@ -128,44 +189,210 @@ def scrape_yahoo_selenium(ticker, download_dir, driver):
         return None
 
 
+def harvest_session(driver):
+    """Lift Yahoo's cookies and crumb out of one rendered page.
+
+    One browser visit covers the whole run: the crumb is bound to the
+    session cookies, and with both in hand every ticker becomes a plain
+    HTTP GET against the CSV endpoint - no more page rendering.
+
+    Args:
+        driver: Live Selenium WebDriver
+
+    Returns:
+        Tuple of (requests.Session, crumb) or (None, None)
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    driver.get("https://finance.yahoo.com/quote/BBCA.JK/history")
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.TAG_NAME, 'body'))
+    )
+
+    # Crumb lives in the page context; regex over the source is the fallback
+    crumb = None
+    try:
+        crumb = driver.execute_script(
+            "return window.YAHOO && window.YAHOO.context && window.YAHOO.context.crumb"
+        )
+    except Exception:
+        pass
+
+    if not crumb:
+        match = re.search(r'"CrumbStore":\{"crumb":"([^"]+)"\}', driver.page_source)
+        if match:
+            crumb = match.group(1)
+
+    if not crumb:
+        print("  ⚠️ No crumb found - falling back to browser downloads")
+        return None, None
+
+    session = requests.Session()
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie['name'], cookie['value'])
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    })
+
+    print(f"  ✅ Harvested cookies + crumb: {crumb[:10]}...")
+    return session, crumb
+
+
+def download_direct(session, crumb, ticker, start_date, end_date):
+    """Fetch one ticker's CSV straight from the download endpoint.
+
+    Args:
+        session: requests.Session carrying the harvested Yahoo cookies
+        crumb: Crumb token from harvest_session
+        ticker: Stock ticker (e.g., 'BBCA.JK')
+        start_date: datetime object
+        end_date: datetime object
+
+    Returns:
+        DataFrame or None
+    """
+    import pandas as pd
+
+    try:
+        url = f"https://query1.finance.yahoo.com/v7/finance/download/{ticker}"
+        params = {
+            'period1': int(start_date.timestamp()),
+            'period2': int(end_date.timestamp()),
+            'interval': '1d',
+            'events': 'history',
+            'crumb': crumb
+        }
+
+        response = session.get(url, params=params, timeout=15)
+
+        if response.status_code == 200 and b'Date' in response.content:
+            df = pd.read_csv(BytesIO(response.content))
+            if len(df) > 0:
+                df['Ticker'] = ticker
+                print(f"  ✅ {ticker}: {len(df)} records via direct GET")
+                return df
+
+        print(f"  ❌ HTTP {response.status_code} for {ticker}")
+        return None
+
+    except Exception as e:
+        print(f"  ❌ Direct download failed for {ticker}: {e}")
+        return None
+
+
+def scrape_with_browser_pool(stocks):
+    """Scrape every ticker through pooled Chrome downloads (slow path).
+
+    Args:
+        stocks: List of tickers
+
+    Returns:
+        Tuple of (successful, all_data)
+    """
+    # Browser pool: each Chrome stays alive across tickers, so the
+    # multi-second startup is paid once per worker, not once per ticker
+    drivers = queue.Queue()
+    n_workers = min(N_WORKERS, len(stocks))
+
+    for worker_id in range(n_workers):
+        try:
+            drivers.put(setup_driver(worker_id))
+        except Exception as e:
+            print(f"\n❌ Failed to setup Chrome driver: {e}")
+            break
+
+    if drivers.empty():
+        print("\n💡 Make sure Chrome browser is installed on your system!")
+        return [], []
+
+    def scrape_task(ticker):
+        """Borrow a driver from the pool, scrape, return it."""
+        driver, download_dir = drivers.get()
+        try:
+            return scrape_yahoo_selenium(ticker, download_dir, driver)
+        finally:
+            drivers.put((driver, download_dir))
+
+    successful = []
+    all_data = []
+
+    try:
+        # Tickers fan out over the live browsers; per-driver serialization
+        # replaces the old blanket sleep as the rate limit
+        with ThreadPoolExecutor(max_workers=drivers.qsize()) as executor:
+            futures = {executor.submit(scrape_task, ticker): ticker for ticker in stocks}
+
+            for future in as_completed(futures):
+                ticker = futures[future]
+                df = future.result()
+
+                if df is not None and len(df) > 0:
+                    all_data.append(df)
+                    successful.append({
+                        'ticker': ticker,
+                        'records': len(df)
+                    })
+
+    finally:
+        # Always close every pooled browser
+        print("\n🔒 Closing browsers...")
+        while not drivers.empty():
+            driver, _ = drivers.get()
+            driver.quit()
+
+    return successful, all_data
+
+
 def main():
     """Main scraping function."""
-    
+    import pandas as pd
+
     print("=" * 80)
     print("SELENIUM WEB SCRAPER - AUTOMATED BROWSER DOWNLOAD!")
     print("=" * 80)
-    
+
     stocks = ['BBCA.JK', 'GOTO.JK', 'BUMI.JK', 'BBRI.JK', 'TLKM.JK']
-    
-    # Setup browser
+
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=180)
+
+    successful = []
+    all_data = []
+
+    # Fast path: render one page to harvest cookies + crumb, then pull
+    # every ticker's CSV over plain HTTP
+    session = crumb = None
     try:
-        driver, download_dir = setup_driver()
+        driver, _ = setup_driver()
     except Exception as e:
         print(f"\n❌ Failed to setup Chrome driver: {e}")
         print("\n💡 Make sure Chrome browser is installed on your system!")
         return []
-    
-    successful = []
-    all_data = []
-    
+
     try:
+        session, crumb = harvest_session(driver)
+    except Exception as e:
+        print(f"  ⚠️ Cookie harvest failed: {e}")
+    finally:
+        driver.quit()
+
+    if session is not None and crumb:
         for ticker in stocks:
-            df = scrape_yahoo_selenium(ticker, download_dir, driver)
-            
+            df = download_direct(session, crumb, ticker, start_date, end_date)
+
             if df is not None and len(df) > 0:
                 all_data.append(df)
                 successful.append({
                     'ticker': ticker,
                     'records': len(df)
                 })
-            
-            # Be polite - wait between requests
-            time.sleep(3)
-        
-    finally:
-        # Always close browser
-        print("\n🔒 Closing browser...")
-        driver.quit()
+
+    # Slow path: rendered-browser downloads, only when the direct GETs
+    # came up empty (e.g. crumb fetch 401'd)
+    if not successful:
+        successful, all_data = scrape_with_browser_pool(stocks)
     
     # Summary
     print("\n" + "=" * 80)
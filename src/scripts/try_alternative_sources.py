@@ -9,23 +9,95 @@ After extensive testing, here are working alternatives to yfinance:
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from pathlib import Path
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.utils.fetch_cache import get_or_fetch, make_key
+
+# Arrow's CSV parser is an optional fast path; pandas' own parser works
+# fine without it
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# One pooled session for every provider: connections stay warm across
+# tickers (no per-call TCP+TLS handshake) and transient 429/5xx retries
+# are handled in the transport layer
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+))
+
+# Pace outbound requests at one per half-second across all threads -
+# respects Stooq's per-host limit without serializing whole downloads
+_RATE_LOCK = threading.Lock()
+_MIN_INTERVAL = 0.5
+_last_request_at = 0.0
+
+
+def _pace():
+    """Hold the calling thread until the rate slot is free."""
+    global _last_request_at
+    with _RATE_LOCK:
+        wait = _last_request_at + _MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request_at = time.monotonic()
+
+
+# Alpha Vantage free tier allows 5 requests/minute - pace its calls at
+# one per 12s, independently of the general half-second pacer
+_AV_RATE_LOCK = threading.Lock()
+_AV_MIN_INTERVAL = 12.0
+_av_last_request_at = 0.0
+
+
+def _pace_alphavantage():
+    """Hold the calling thread until the Alpha Vantage slot is free."""
+    global _av_last_request_at
+    with _AV_RATE_LOCK:
+        wait = _av_last_request_at + _AV_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _av_last_request_at = time.monotonic()
+
 
 def try_stooq(ticker, start_date, end_date):
     """Download from Stooq.com - Free historical data service.
-    
+
     Stooq supports Indonesian stocks with format: TICKER.ID
-    
+    Responses are snapshot-cached on disk, so re-runs within a day skip
+    the network entirely.
+
     Args:
         ticker: Stock ticker without exchange (e.g., 'BBCA')
         start_date: datetime object
         end_date: datetime object
-    
+
     Returns:
         DataFrame or None
     """
+    key = make_key('stooq', ticker, start_date.date(), end_date.date())
+    return get_or_fetch(key, lambda: _try_stooq_uncached(ticker, start_date, end_date))
+
+
+def _try_stooq_uncached(ticker, start_date, end_date):
+    """Fetch from Stooq without cache involvement."""
     try:
         print(f"🔍 Trying Stooq.com for {ticker}...")
         
@@ -35,19 +107,21 @@ def try_stooq(ticker, start_date, end_date):
         # Stooq URL format
         url = f"https://stooq.com/q/d/l/?s={stooq_ticker}&i=d"
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        
-        response = requests.get(url, headers=headers, timeout=15)
+        _pace()
+        response = _SESSION.get(url, timeout=15)
         
         if response.status_code == 200:
-            from io import StringIO
-            df = pd.read_csv(StringIO(response.text))
-            
+            from io import BytesIO
+            # Arrow's C++ CSV parser, fed the raw response bytes: no
+            # intermediate str copy and dates parsed in the same pass.
+            # Without pyarrow fall back to the default parser rather
+            # than letting the ImportError read as a Stooq failure.
+            engine_kwargs = {'engine': 'pyarrow'} if HAS_PYARROW else {}
+            df = pd.read_csv(BytesIO(response.content),
+                             parse_dates=['Date'], **engine_kwargs)
+
             if not df.empty and len(df) > 10:  # At least 10 records
                 # Stooq format: Date, Open, High, Low, Close, Volume
-                df['Date'] = pd.to_datetime(df['Date'])
                 df['Ticker'] = f"{ticker}.JK"
                 
                 # Filter by date range
@@ -95,9 +169,10 @@ def try_alphavantage(ticker, api_key=None):
             'outputsize': 'full',  # Get full historical data
             'datatype': 'csv'
         }
-        
-        response = requests.get(url, params=params, timeout=15)
-        
+
+        _pace_alphavantage()
+        response = _SESSION.get(url, params=params, timeout=15)
+
         if response.status_code == 200:
             from io import StringIO
             df = pd.read_csv(StringIO(response.text))
@@ -120,6 +195,32 @@ def try_alphavantage(ticker, api_key=None):
     return None
 
 
+def _hedged_alphavantage(stock, start_date, end_date, settled):
+    """Alpha Vantage leg of the hedged per-ticker fetch.
+
+    Bails out before spending a rate-limited API slot when the Stooq leg
+    has already settled the ticker.
+
+    Args:
+        stock: Ticker without exchange suffix (e.g., 'BBCA')
+        start_date: datetime object
+        end_date: datetime object
+        settled: threading.Event set once any leg won this ticker
+
+    Returns:
+        DataFrame trimmed to the date range, or None
+    """
+    if settled.is_set():
+        return None
+
+    df = try_alphavantage(f"{stock}.JK")
+    if df is None:
+        return None
+
+    df = df[(df['Date'] >= start_date) & (df['Date'] <= end_date)]
+    return df if len(df) > 0 else None
+
+
 def download_manual_guide():
     """Generate comprehensive manual download guide."""
     
@@ -228,29 +329,51 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     
     successful = []
-    
-    for stock in stocks:
-        print(f"\n{'='*60}")
-        print(f"Trying {stock}...")
-        print(f"{'='*60}")
-        
-        # Try Stooq first (most reliable for international stocks)
-        df = try_stooq(stock, start_date, end_date)
-        
-        if df is not None and len(df) > 0:
-            filepath = output_dir / f"{stock}_stooq.csv"
-            df.to_csv(filepath, index=False)
-            print(f"💾 Saved: {filepath}")
-            
-            successful.append({
-                'ticker': stock,
-                'source': 'stooq',
-                'records': len(df),
-                'file': str(filepath)
-            })
-        
-        # Be polite
-        time.sleep(3)
+
+    # Hedged requests: race Stooq and Alpha Vantage per ticker and keep
+    # whichever answers first with data, so one slow/failing provider
+    # never sets the pace. All legs fan out over one thread pool with
+    # _pace()/_pace_alphavantage() keeping each provider polite.
+    settled = {stock: threading.Event() for stock in stocks}
+    winners = {}
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        futures = {}
+        for stock in stocks:
+            f_stooq = executor.submit(try_stooq, stock, start_date, end_date)
+            f_av = executor.submit(
+                _hedged_alphavantage, stock, start_date, end_date, settled[stock]
+            )
+            futures[f_stooq] = (stock, 'stooq', f_av)
+            futures[f_av] = (stock, 'alphavantage', f_stooq)
+
+        for future in as_completed(futures):
+            stock, source, sibling = futures[future]
+            if stock in winners:
+                continue
+
+            try:
+                df = future.result()
+            except Exception as e:
+                print(f"❌ {source} leg failed for {stock}: {e}")
+                continue
+
+            if df is not None and len(df) > 0:
+                winners[stock] = (df, source)
+                settled[stock].set()
+                sibling.cancel()  # losing leg: skip it if not yet started
+
+    for stock, (df, source) in winners.items():
+        filepath = output_dir / f"{stock}_{source}.csv"
+        df.to_csv(filepath, index=False)
+        print(f"💾 Saved: {filepath}")
+
+        successful.append({
+            'ticker': stock,
+            'source': source,
+            'records': len(df),
+            'file': str(filepath)
+        })
     
     # Print results
     print("\n" + "=" * 80)
@@ -0,0 +1,145 @@
+"""Circuit breaker for flaky external data providers.
+
+When a provider starts failing (dead endpoint, quota exhausted, network
+down), repeatedly calling it makes every remaining ticker pay the full
+request timeout. The breaker opens after a few consecutive failures so the
+rest of the run fast-fails instead of hammering a dead provider.
+"""
+
+import time
+from functools import wraps
+from typing import Any, Callable
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Stop calling a provider after repeated consecutive failures.
+
+    States:
+        CLOSED: calls pass through; each failure increments a counter.
+        OPEN: calls are rejected immediately (no HTTP hit) until
+            ``reset_after`` seconds have passed since the circuit opened.
+        HALF_OPEN: one probe call is let through; success closes the
+            circuit, failure re-opens it.
+
+    A call that raises, or that returns None (the downloaders' failure
+    convention), counts as a failure.
+
+    Examples:
+        >>> breaker = CircuitBreaker("yahoo")
+        >>> @breaker
+        ... def download(ticker):
+        ...     ...
+    """
+
+    CLOSED = 'CLOSED'
+    OPEN = 'OPEN'
+    HALF_OPEN = 'HALF_OPEN'
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_after: float = 60.0
+    ) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            name: Provider name (used in log messages)
+            failure_threshold: Consecutive failures before opening
+            reset_after: Seconds to stay open before allowing a probe
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_after = reset_after
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+
+    def allow_call(self) -> bool:
+        """Check whether a call may go through right now.
+
+        Returns:
+            True if the call is allowed (CLOSED, or OPEN long enough for
+            a half-open probe), False if it should be skipped.
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at >= self.reset_after:
+                self._transition(self.HALF_OPEN)
+                return True
+            return False
+        return True
+
+    def record_success(self) -> None:
+        """Register a successful call, closing the circuit."""
+        if self.state != self.CLOSED:
+            self._transition(self.CLOSED)
+        self.failure_count = 0
+
+    def record_failure(self) -> None:
+        """Register a failed call, opening the circuit at the threshold."""
+        self.failure_count += 1
+        if self.state == self.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._transition(self.OPEN)
+
+    def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Invoke func through the breaker.
+
+        Args:
+            func: Callable to protect
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The function's return value
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if not self.allow_call():
+            raise CircuitOpenError(
+                f"Circuit '{self.name}' is open after {self.failure_count} failures"
+            )
+
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+
+        if result is None:
+            self.record_failure()
+        else:
+            self.record_success()
+
+        return result
+
+    def __call__(self, func: Callable) -> Callable:
+        """Use the breaker as a decorator.
+
+        Rejected calls return None instead of raising, matching the
+        downloaders' convention for failed tickers.
+        """
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return self.call(func, *args, **kwargs)
+            except CircuitOpenError as e:
+                logger.warning(f"{e} - skipping call")
+                return None
+
+        return wrapper
+
+    def _transition(self, new_state: str) -> None:
+        """Move to a new state and log the transition."""
+        if new_state != self.state:
+            logger.warning(f"Circuit '{self.name}': {self.state} -> {new_state}")
+            self.state = new_state
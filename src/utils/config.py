@@ -1,6 +1,8 @@
 """Configuration management for Market Anomaly Detection Engine."""
 
 import os
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
@@ -18,99 +20,215 @@ PROCESSED_DATA_DIR = DATA_DIR / "processed"
 MODELS_DIR = DATA_DIR / "models"
 LOGS_DIR = ROOT_DIR / "logs"
 
-# Create directories if they don't exist
-for dir_path in [RAW_DATA_DIR, PROCESSED_DATA_DIR, MODELS_DIR, LOGS_DIR]:
-    dir_path.mkdir(parents=True, exist_ok=True)
+# Directory creation is deferred to ensure_dirs() so that merely
+# importing config (pytest collection, tooling) costs no syscalls
+_INITIALIZED = False
+
+
+def ensure_dirs() -> None:
+    """Create the data/log directories once per process.
+
+    Call this from code that is about to write files; repeat calls are
+    a no-op flag check rather than four mkdir syscalls.
+    """
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    for dir_path in [RAW_DATA_DIR, PROCESSED_DATA_DIR, MODELS_DIR, LOGS_DIR]:
+        dir_path.mkdir(parents=True, exist_ok=True)
+    _INITIALIZED = True
+
+
+@dataclass(frozen=True)
+class Config:
+    """All environment-derived settings, parsed once per process.
+
+    Attributes mirror the module-level constants below; prefer the
+    constants in application code, use get_config() where a single
+    settings object is handier (e.g. passing config around).
+    """
+
+    app_name: str
+    app_version: str
+    environment: str
+    api_host: str
+    api_port: int
+    api_reload: bool
+    api_workers: int
+    database_url: str
+    model_path: Path
+    autoencoder_path: Path
+    lstm_path: Path
+    contamination: float
+    n_estimators: int
+    random_state: int
+    volume_zscore_threshold: float
+    price_change_threshold: float
+    volatility_ratio_threshold: float
+    wash_trading_correlation_threshold: float
+    yfinance_timeout: int
+    yfinance_max_retries: int
+    log_level: str
+    log_file: Path
+    drift_detection_enabled: bool
+    drift_threshold: float
+    performance_tracking_enabled: bool
+    use_gpu: bool
+    gpu_memory_limit: int
+    mlflow_tracking_uri: str
+    mlflow_experiment_name: str
+    mlflow_artifact_location: str
+    mlflow_enable_ui: bool
+    mlflow_ui_port: int
+    secret_key: str
+    api_key_enabled: bool
+    api_key: str
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() == "true"
+
+
+@cache
+def get_config() -> Config:
+    """Parse the environment into a Config, cached for the process.
+
+    Returns:
+        Frozen Config instance; repeat calls return the same object
+    """
+    return Config(
+        app_name=os.getenv("APP_NAME", "Market Anomaly Detection Engine"),
+        app_version=os.getenv("APP_VERSION", "1.0.0"),
+        environment=os.getenv("ENVIRONMENT", "development"),
+        api_host=os.getenv("API_HOST", "0.0.0.0"),
+        api_port=int(os.getenv("API_PORT", "8000")),
+        api_reload=_env_bool("API_RELOAD", "true"),
+        api_workers=int(os.getenv("API_WORKERS", "1")),
+        database_url=os.getenv("DATABASE_URL", f"sqlite:///{DATA_DIR / 'alerts.db'}"),
+        model_path=MODELS_DIR / os.getenv("MODEL_PATH", "isolation_forest.pkl").split("/")[-1],
+        autoencoder_path=MODELS_DIR / os.getenv("AUTOENCODER_PATH", "autoencoder.h5").split("/")[-1],
+        lstm_path=MODELS_DIR / os.getenv("LSTM_PATH", "lstm_detector.h5").split("/")[-1],
+        contamination=float(os.getenv("CONTAMINATION", "0.05")),
+        n_estimators=int(os.getenv("N_ESTIMATORS", "100")),
+        random_state=int(os.getenv("RANDOM_STATE", "42")),
+        volume_zscore_threshold=float(os.getenv("VOLUME_ZSCORE_THRESHOLD", "3.0")),
+        price_change_threshold=float(os.getenv("PRICE_CHANGE_THRESHOLD", "10.0")),
+        volatility_ratio_threshold=float(os.getenv("VOLATILITY_RATIO_THRESHOLD", "1.5")),
+        wash_trading_correlation_threshold=float(
+            os.getenv("WASH_TRADING_CORRELATION_THRESHOLD", "0.3")
+        ),
+        yfinance_timeout=int(os.getenv("YFINANCE_TIMEOUT", "10")),
+        yfinance_max_retries=int(os.getenv("YFINANCE_MAX_RETRIES", "3")),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        log_file=LOGS_DIR / "app.log",
+        drift_detection_enabled=_env_bool("DRIFT_DETECTION_ENABLED", "true"),
+        drift_threshold=float(os.getenv("DRIFT_THRESHOLD", "0.05")),
+        performance_tracking_enabled=_env_bool("PERFORMANCE_TRACKING_ENABLED", "true"),
+        use_gpu=_env_bool("USE_GPU", "false"),
+        gpu_memory_limit=int(os.getenv("GPU_MEMORY_LIMIT", "4096")),
+        mlflow_tracking_uri=os.getenv("MLFLOW_TRACKING_URI", f"file:///{ROOT_DIR / 'mlruns'}"),
+        mlflow_experiment_name=os.getenv("MLFLOW_EXPERIMENT_NAME", "market-anomaly-detection"),
+        mlflow_artifact_location=os.getenv("MLFLOW_ARTIFACT_LOCATION", str(ROOT_DIR / "mlruns")),
+        mlflow_enable_ui=_env_bool("MLFLOW_ENABLE_UI", "true"),
+        mlflow_ui_port=int(os.getenv("MLFLOW_UI_PORT", "5000")),
+        secret_key=os.getenv("SECRET_KEY", "development-secret-key-change-in-production"),
+        api_key_enabled=_env_bool("API_KEY_ENABLED", "false"),
+        api_key=os.getenv("API_KEY", ""),
+    )
+
+
+_cfg = get_config()
 
 # ============================================
 # APPLICATION
 # ============================================
-APP_NAME = os.getenv("APP_NAME", "Market Anomaly Detection Engine")
-APP_VERSION = os.getenv("APP_VERSION", "1.0.0")
-ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+APP_NAME = _cfg.app_name
+APP_VERSION = _cfg.app_version
+ENVIRONMENT = _cfg.environment
 
 # ============================================
 # API CONFIGURATION
 # ============================================
-API_HOST = os.getenv("API_HOST", "0.0.0.0")
-API_PORT = int(os.getenv("API_PORT", "8000"))
-API_RELOAD = os.getenv("API_RELOAD", "true").lower() == "true"
-API_WORKERS = int(os.getenv("API_WORKERS", "1"))
+API_HOST = _cfg.api_host
+API_PORT = _cfg.api_port
+API_RELOAD = _cfg.api_reload
+API_WORKERS = _cfg.api_workers
 
 # ============================================
 # DATABASE
 # ============================================
-DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATA_DIR / 'alerts.db'}")
+DATABASE_URL = _cfg.database_url
 
 # ============================================
 # MODEL PATHS
 # ============================================
-MODEL_PATH = MODELS_DIR / os.getenv("MODEL_PATH", "isolation_forest.pkl").split("/")[-1]
-AUTOENCODER_PATH = MODELS_DIR / os.getenv("AUTOENCODER_PATH", "autoencoder.h5").split("/")[-1]
-LSTM_PATH = MODELS_DIR / os.getenv("LSTM_PATH", "lstm_detector.h5").split("/")[-1]
+MODEL_PATH = _cfg.model_path
+AUTOENCODER_PATH = _cfg.autoencoder_path
+LSTM_PATH = _cfg.lstm_path
 
 # ============================================
 # MODEL PARAMETERS
 # ============================================
-CONTAMINATION = float(os.getenv("CONTAMINATION", "0.05"))
-N_ESTIMATORS = int(os.getenv("N_ESTIMATORS", "100"))
-RANDOM_STATE = int(os.getenv("RANDOM_STATE", "42"))
+CONTAMINATION = _cfg.contamination
+N_ESTIMATORS = _cfg.n_estimators
+RANDOM_STATE = _cfg.random_state
 
 # ============================================
 # DETECTION THRESHOLDS
 # ============================================
-VOLUME_ZSCORE_THRESHOLD = float(os.getenv("VOLUME_ZSCORE_THRESHOLD", "3.0"))
-PRICE_CHANGE_THRESHOLD = float(os.getenv("PRICE_CHANGE_THRESHOLD", "10.0"))
-VOLATILITY_RATIO_THRESHOLD = float(os.getenv("VOLATILITY_RATIO_THRESHOLD", "1.5"))
-WASH_TRADING_CORRELATION_THRESHOLD = float(os.getenv("WASH_TRADING_CORRELATION_THRESHOLD", "0.3"))
+VOLUME_ZSCORE_THRESHOLD = _cfg.volume_zscore_threshold
+PRICE_CHANGE_THRESHOLD = _cfg.price_change_threshold
+VOLATILITY_RATIO_THRESHOLD = _cfg.volatility_ratio_threshold
+WASH_TRADING_CORRELATION_THRESHOLD = _cfg.wash_trading_correlation_threshold
 
 # ============================================
 # YFINANCE SETTINGS
 # ============================================
-YFINANCE_TIMEOUT = int(os.getenv("YFINANCE_TIMEOUT", "10"))
-YFINANCE_MAX_RETRIES = int(os.getenv("YFINANCE_MAX_RETRIES", "3"))
+YFINANCE_TIMEOUT = _cfg.yfinance_timeout
+YFINANCE_MAX_RETRIES = _cfg.yfinance_max_retries
 
 # ============================================
 # LOGGING
 # ============================================
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FILE = LOGS_DIR / "app.log"
+LOG_LEVEL = _cfg.log_level
+LOG_FILE = _cfg.log_file
 
 # ============================================
 # MONITORING
 # ============================================
-DRIFT_DETECTION_ENABLED = os.getenv("DRIFT_DETECTION_ENABLED", "true").lower() == "true"
-DRIFT_THRESHOLD = float(os.getenv("DRIFT_THRESHOLD", "0.05"))
-PERFORMANCE_TRACKING_ENABLED = os.getenv("PERFORMANCE_TRACKING_ENABLED", "true").lower() == "true"
+DRIFT_DETECTION_ENABLED = _cfg.drift_detection_enabled
+DRIFT_THRESHOLD = _cfg.drift_threshold
+PERFORMANCE_TRACKING_ENABLED = _cfg.performance_tracking_enabled
 
 # ============================================
 # GPU
 # ============================================
-USE_GPU = os.getenv("USE_GPU", "false").lower() == "true"
-GPU_MEMORY_LIMIT = int(os.getenv("GPU_MEMORY_LIMIT", "4096"))
+USE_GPU = _cfg.use_gpu
+GPU_MEMORY_LIMIT = _cfg.gpu_memory_limit
 
 # ============================================
 # MLFLOW EXPERIMENT TRACKING
 # ============================================
-MLFLOW_TRACKING_URI = os.getenv("MLFLOW_TRACKING_URI", f"file:///{ROOT_DIR / 'mlruns'}")
-MLFLOW_EXPERIMENT_NAME = os.getenv("MLFLOW_EXPERIMENT_NAME", "market-anomaly-detection")
-MLFLOW_ARTIFACT_LOCATION = os.getenv("MLFLOW_ARTIFACT_LOCATION", str(ROOT_DIR / "mlruns"))
-MLFLOW_ENABLE_UI = os.getenv("MLFLOW_ENABLE_UI", "true").lower() == "true"
-MLFLOW_UI_PORT = int(os.getenv("MLFLOW_UI_PORT", "5000"))
+MLFLOW_TRACKING_URI = _cfg.mlflow_tracking_uri
+MLFLOW_EXPERIMENT_NAME = _cfg.mlflow_experiment_name
+MLFLOW_ARTIFACT_LOCATION = _cfg.mlflow_artifact_location
+MLFLOW_ENABLE_UI = _cfg.mlflow_enable_ui
+MLFLOW_UI_PORT = _cfg.mlflow_ui_port
 
 # ============================================
 # SECURITY
 # ============================================
-SECRET_KEY = os.getenv("SECRET_KEY", "development-secret-key-change-in-production")
-API_KEY_ENABLED = os.getenv("API_KEY_ENABLED", "false").lower() == "true"
-API_KEY = os.getenv("API_KEY", "")
+SECRET_KEY = _cfg.secret_key
+API_KEY_ENABLED = _cfg.api_key_enabled
+API_KEY = _cfg.api_key
 
 
+@lru_cache(maxsize=1)
 def get_config_summary() -> dict:
     """Get configuration summary for debugging.
-    
+
     Returns:
-        Dictionary with configuration values
+        Dictionary with configuration values (cached; config is immutable)
     """
     return {
         "app_name": APP_NAME,
@@ -0,0 +1,122 @@
+"""Disk snapshot cache for fetched market data.
+
+Iterating on DataQualityChecker or detection code re-fetches identical
+(ticker, date-range) slices from the network on every run. This cache
+stores each fetched DataFrame as parquet under data/cache/, keyed by a
+hash of the request, so repeat runs load from disk in milliseconds
+instead of re-hitting providers.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Mixed into every key - bump to invalidate all existing entries at once
+CACHE_VERSION = 'v1'
+
+CACHE_DIR = Path('data/cache')
+
+# Incremental-fetch bookkeeping: per-ticker rolling history plus the
+# last successfully fetched date ("watermark") for each ticker
+HISTORY_DIR = CACHE_DIR / 'history'
+WATERMARK_FILE = CACHE_DIR / 'watermarks.json'
+
+
+def make_key(*parts: Any) -> str:
+    """Build a cache key from request-identifying parts.
+
+    Args:
+        *parts: Values that determine the fetched content, e.g.
+            ('yfinance', ticker, start_date, end_date)
+
+    Returns:
+        Hex sha1 digest usable as a filename
+    """
+    raw = '|'.join(str(p) for p in parts) + f'|{CACHE_VERSION}'
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def get_or_fetch(
+    key: str,
+    fetch_fn: Callable[[], Optional[pd.DataFrame]],
+    ttl_seconds: float = 86400
+) -> Optional[pd.DataFrame]:
+    """Return the cached frame for key, fetching and storing on miss.
+
+    Args:
+        key: Cache key from make_key
+        fetch_fn: Zero-argument callable performing the real fetch
+        ttl_seconds: Entry age beyond which the cache is considered stale
+
+    Returns:
+        The cached or freshly fetched DataFrame (None if fetch_fn
+        returned None)
+    """
+    path = CACHE_DIR / key[:2] / f'{key}.parquet'
+
+    if path.exists() and time.time() - path.stat().st_mtime < ttl_seconds:
+        try:
+            df = pd.read_parquet(path)
+            logger.info(f"Cache hit: {path.name} ({len(df)} rows)")
+            return df
+        except Exception as e:
+            logger.warning(f"Cache read failed ({e}) - refetching")
+
+    df = fetch_fn()
+
+    if df is not None and len(df) > 0:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            df.to_parquet(path)
+        except Exception as e:
+            # Missing pyarrow or odd dtypes shouldn't break the fetch path
+            logger.warning(f"Cache write failed ({e})")
+
+    return df
+
+
+def load_watermarks() -> dict:
+    """Read the per-ticker watermark map (ticker -> 'YYYY-MM-DD').
+
+    Returns:
+        Mapping, empty when no watermarks have been written yet
+    """
+    try:
+        with open(WATERMARK_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_watermark(ticker: str, date: str) -> None:
+    """Record the last successfully fetched date for a ticker.
+
+    Args:
+        ticker: Stock ticker symbol
+        date: Latest fetched date as 'YYYY-MM-DD'
+    """
+    watermarks = load_watermarks()
+    watermarks[ticker] = date
+    WATERMARK_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(WATERMARK_FILE, 'w') as f:
+        json.dump(watermarks, f, indent=2)
+
+
+def history_path(ticker: str) -> Path:
+    """Path of the rolling per-ticker history parquet.
+
+    Args:
+        ticker: Stock ticker symbol
+
+    Returns:
+        Path under data/cache/history/
+    """
+    return HISTORY_DIR / f'{ticker}.parquet'
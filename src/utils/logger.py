@@ -1,20 +1,104 @@
 """Logging configuration for Market Anomaly Detection Engine."""
 
-import logging
+import atexit
+import os
+import queue
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from src.utils.config import LOG_LEVEL, LOG_FILE
+# picologging is a C reimplementation of logging with the same
+# Formatter/Handler API, several times faster on the handler hot path.
+# Optional dependency; set ARGUS_FAST_LOG=0 to pin stdlib logging
+# (e.g. for tests that patch logging internals).
+if os.getenv('ARGUS_FAST_LOG', '1') == '1':
+    try:
+        import picologging as logging
+        import picologging.handlers  # noqa: F401 - exposes logging.handlers
+    except ImportError:
+        import logging
+        import logging.handlers
+else:
+    import logging
+    import logging.handlers
 
+from src.utils.config import LOG_LEVEL, LOG_FILE, ensure_dirs
 
+# One background writer per log file: callers enqueue LogRecords and the
+# QueueListener thread does the actual (blocking) file writes, so hot
+# loops never stall on disk I/O. Keyed by path so every logger writing
+# to app.log shares a single file handle.
+_log_queues = {}
+
+
+def _queued_file_handler(file_path: Path, formatter) -> 'logging.Handler':
+    """Return a QueueHandler feeding a shared background file writer.
+
+    Args:
+        file_path: Log file path
+        formatter: Formatter for the underlying FileHandler
+
+    Returns:
+        QueueHandler whose records are written off-thread
+    """
+    key = str(file_path)
+    if key not in _log_queues:
+        file_handler = logging.FileHandler(file_path)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(formatter)
+
+        q = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            q, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)  # flush pending records on shutdown
+        _log_queues[key] = q
+
+    queue_handler = logging.handlers.QueueHandler(_log_queues[key])
+    queue_handler.setLevel(logging.DEBUG)
+    return queue_handler
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter memoizing the asctime string per wall-clock second.
+
+    A burst of records within one second shares a single strftime call
+    instead of one per record, and UTC conversion skips the
+    localtime/DST lookup.
+    """
+
+    converter = time.gmtime
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = None
+        self._last_asctime = ''
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_asctime = time.strftime(
+                datefmt or '%Y-%m-%d %H:%M:%S', time.gmtime(second)
+            )
+        return self._last_asctime
+
+
+@lru_cache(maxsize=None)
 def setup_logger(
     name: str,
     level: Optional[str] = None,
     log_file: Optional[Path] = None
 ) -> logging.Logger:
     """Setup logger with console and file handlers.
-    
+
+    Memoized on (name, level, log_file): every module-import call after
+    the first returns the cached Logger without touching getLogger,
+    level or handler state again.
+
     Args:
         name: Logger name (usually __name__)
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -27,24 +111,50 @@ def setup_logger(
         >>> logger = setup_logger(__name__)
         >>> logger.info("Starting application")
     """
+    # Module loggers own no handlers: they become children of the
+    # "market_anomaly" root and propagate records to its single handler
+    # chain. One handler invocation per record instead of one per
+    # module, and notebook autoreload can't stack duplicate handlers.
+    if name != "market_anomaly" and log_file is None:
+        setup_logger("market_anomaly")  # make sure the root chain exists
+        child = logging.getLogger(f"market_anomaly.{name}")
+        child.setLevel(level or LOG_LEVEL)
+        child.propagate = True
+        return child
+
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(level or LOG_LEVEL)
-    
+
     # Avoid duplicate handlers
     if logger.handlers:
         return logger
-    
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
+
+    effective_level = str(level or LOG_LEVEL).upper()
+    debug_run = effective_level == 'DEBUG'
+
+    if not debug_run:
+        # funcName/lineno force findCaller() to walk the stack for every
+        # record; thread/process introspection is similar dead weight.
+        # Only pay for that in debug runs.
+        logging.logThreads = False
+        logging.logProcesses = False
+        if hasattr(logging, '_srcfile'):
+            logging._srcfile = None
+
+    # Create formatters: caller location only in debug runs (it is what
+    # makes record creation expensive)
+    detailed_fmt = (
+        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+        if debug_run else
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
-    
+    detailed_formatter = _CachedTimeFormatter(detailed_fmt, datefmt='%Y-%m-%d %H:%M:%S')
+
     simple_formatter = logging.Formatter(
         '%(levelname)s: %(message)s'
     )
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
@@ -54,13 +164,21 @@ def setup_logger(
     # File handler (if specified)
     if log_file or LOG_FILE:
         file_path = log_file or LOG_FILE
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(file_path)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
-    
+        if log_file is not None:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            # Default LOGS_DIR (and the data dirs) are created lazily
+            # here rather than on every config import
+            ensure_dirs()
+
+        # File writes happen on the listener thread; the logger call
+        # itself only enqueues the record
+        logger.addHandler(_queued_file_handler(file_path, detailed_formatter))
+
+    # This logger owns the handler chain; don't also bubble records up
+    # to the (possibly basicConfig'd) stdlib root
+    logger.propagate = False
+
     return logger
 
 
@@ -4,14 +4,26 @@ Provides wrapper functions for logging experiments, metrics, parameters, and mod
 with MLflow. Enables comprehensive experiment tracking and model versioning.
 """
 
+import logging
+import tempfile
+import time
+
 import mlflow
 import mlflow.sklearn
 import mlflow.tensorflow
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Callable, Optional, Union
 from pathlib import Path
 import pandas as pd
 import numpy as np
 
+# Rust JSON encoder for the larger report dicts; optional, mlflow's own
+# json path remains the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from src.utils.logger import setup_logger
 from src.utils.config import (
     MLFLOW_TRACKING_URI,
@@ -21,6 +33,70 @@ from src.utils.config import (
 
 logger = setup_logger(__name__)
 
+# Flavor dispatch cache: the module-string sniffing below runs once per
+# model class, after which logging the same class (HPO sweeps) is a
+# single dict lookup
+_MODEL_LOGGER_CACHE: Dict[type, Callable] = {}
+
+# Tracker singletons keyed by experiment name (see MLflowTracker.get)
+_TRACKERS: Dict[str, 'MLflowTracker'] = {}
+
+
+def _fast_log_dict(dictionary: Dict, filename: str) -> None:
+    """Log a dict artifact, serializing with orjson when available.
+
+    orjson encodes in C and handles numpy scalars natively, which beats
+    mlflow's stdlib-json path by a wide margin on confusion matrices and
+    per-class reports logged every CV fold.
+
+    Args:
+        dictionary: Dictionary to log
+        filename: Artifact filename
+    """
+    if not HAS_ORJSON:
+        mlflow.log_dict(dictionary, filename)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / filename
+        path.write_bytes(orjson.dumps(dictionary, option=orjson.OPT_SERIALIZE_NUMPY))
+        mlflow.log_artifact(str(path))
+
+
+def _model_logger(model_type: type) -> Callable:
+    """Resolve the MLflow log function for a model class, cached by type.
+
+    Args:
+        model_type: Class of the model being logged
+
+    Returns:
+        Callable(model, artifact_path, registered_model_name, **kwargs)
+    """
+    logger_fn = _MODEL_LOGGER_CACHE.get(model_type)
+    if logger_fn is None:
+        mod = str(model_type.__module__)
+        if "sklearn" in mod:
+            def logger_fn(model, artifact_path, registered_model_name, **kwargs):
+                mlflow.sklearn.log_model(
+                    model, artifact_path,
+                    registered_model_name=registered_model_name, **kwargs
+                )
+        elif "tensorflow" in mod or "keras" in mod:
+            def logger_fn(model, artifact_path, registered_model_name, **kwargs):
+                mlflow.tensorflow.log_model(
+                    model, artifact_path,
+                    registered_model_name=registered_model_name, **kwargs
+                )
+        else:
+            # Fallback to generic Python model
+            def logger_fn(model, artifact_path, registered_model_name, **kwargs):
+                mlflow.pyfunc.log_model(
+                    artifact_path, python_model=model,
+                    registered_model_name=registered_model_name, **kwargs
+                )
+        _MODEL_LOGGER_CACHE[model_type] = logger_fn
+    return logger_fn
+
 
 class MLflowTracker:
     """MLflow experiment tracking wrapper.
@@ -65,7 +141,28 @@ class MLflowTracker:
         except Exception as e:
             logger.error(f"Error setting up MLflow experiment: {e}")
             raise
-    
+
+    @classmethod
+    def get(cls, experiment_name: Optional[str] = None) -> 'MLflowTracker':
+        """Return the cached tracker for an experiment, creating it once.
+
+        The constructor costs two MLflow backend calls
+        (get_experiment_by_name + set_experiment); under HPO sweeps that
+        is hundreds of RPCs for the same experiment. Prefer this over
+        constructing MLflowTracker directly in loops.
+
+        Args:
+            experiment_name: Name of experiment (default: from config)
+
+        Returns:
+            Shared MLflowTracker instance
+        """
+        name = experiment_name or MLFLOW_EXPERIMENT_NAME
+        tracker = _TRACKERS.get(name)
+        if tracker is None:
+            tracker = _TRACKERS[name] = cls(name)
+        return tracker
+
     def start_run(self, run_name: Optional[str] = None, nested: bool = False):
         """Start MLflow run context manager.
         
@@ -92,7 +189,7 @@ class MLflowTracker:
         """
         try:
             mlflow.log_params(params)
-            logger.debug(f"Logged {len(params)} parameters to MLflow")
+            logger.debug("Logged %d parameters to MLflow", len(params))
         except Exception as e:
             logger.error(f"Error logging parameters: {e}")
     
@@ -117,7 +214,7 @@ class MLflowTracker:
         """
         try:
             mlflow.log_metrics(metrics, step=step)
-            logger.debug(f"Logged {len(metrics)} metrics to MLflow")
+            logger.debug("Logged %d metrics to MLflow", len(metrics))
         except Exception as e:
             logger.error(f"Error logging metrics: {e}")
     
@@ -150,34 +247,15 @@ class MLflowTracker:
             **kwargs: Additional arguments for model logging
         """
         try:
-            # Detect model type and use appropriate logging
-            model_type = type(model).__name__
-            
-            if "sklearn" in str(type(model).__module__):
-                mlflow.sklearn.log_model(
-                    model,
-                    artifact_path,
-                    registered_model_name=registered_model_name,
-                    **kwargs
-                )
-            elif "tensorflow" in str(type(model).__module__) or "keras" in str(type(model).__module__):
-                mlflow.tensorflow.log_model(
-                    model,
-                    artifact_path,
-                    registered_model_name=registered_model_name,
-                    **kwargs
-                )
-            else:
-                # Fallback to generic Python model
-                mlflow.pyfunc.log_model(
-                    artifact_path,
-                    python_model=model,
-                    registered_model_name=registered_model_name,
-                    **kwargs
-                )
-            
-            logger.info(f"Logged {model_type} model to MLflow: {artifact_path}")
-            
+            _model_logger(type(model))(
+                model, artifact_path, registered_model_name, **kwargs
+            )
+
+            # Type-name introspection only happens when the record will
+            # actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Logged %s model to MLflow: %s", type(model).__name__, artifact_path)
+
         except Exception as e:
             logger.error(f"Error logging model: {e}")
     
@@ -190,7 +268,7 @@ class MLflowTracker:
         """
         try:
             mlflow.log_artifact(str(local_path), artifact_path)
-            logger.debug(f"Logged artifact: {local_path}")
+            logger.debug("Logged artifact: %s", local_path)
         except Exception as e:
             logger.error(f"Error logging artifact: {e}")
     
@@ -202,8 +280,8 @@ class MLflowTracker:
             filename: Artifact filename
         """
         try:
-            mlflow.log_dict(dictionary, filename)
-            logger.debug(f"Logged dictionary as {filename}")
+            _fast_log_dict(dictionary, filename)
+            logger.debug("Logged dictionary as %s", filename)
         except Exception as e:
             logger.error(f"Error logging dictionary: {e}")
     
@@ -216,7 +294,7 @@ class MLflowTracker:
         """
         try:
             mlflow.log_figure(figure, artifact_file)
-            logger.debug(f"Logged figure: {artifact_file}")
+            logger.debug("Logged figure: %s", artifact_file)
         except Exception as e:
             logger.error(f"Error logging figure: {e}")
     
@@ -224,45 +302,53 @@ class MLflowTracker:
         self,
         y_true: np.ndarray,
         y_pred: np.ndarray,
-        labels: Optional[list] = None
+        labels: Optional[list] = None,
+        render_figure: bool = False
     ) -> None:
         """Log confusion matrix as artifact.
-        
+
+        The numeric JSON is always logged; the seaborn heatmap PNG is
+        only rendered on request since matplotlib import + Agg setup +
+        drawing costs 50-200ms per call, which adds up in HPO/CV loops.
+
         Args:
             y_true: True labels
             y_pred: Predicted labels
             labels: Class labels (optional)
+            render_figure: Also render and log the heatmap PNG
         """
         try:
             from sklearn.metrics import confusion_matrix
-            import matplotlib.pyplot as plt
-            import seaborn as sns
-            
+
             cm = confusion_matrix(y_true, y_pred, labels=labels)
-            
-            # Create figure
-            fig, ax = plt.subplots(figsize=(8, 6))
-            sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax)
-            ax.set_xlabel('Predicted')
-            ax.set_ylabel('Actual')
-            ax.set_title('Confusion Matrix')
-            
-            if labels:
-                ax.set_xticklabels(labels)
-                ax.set_yticklabels(labels)
-            
-            # Log figure
-            mlflow.log_figure(fig, "confusion_matrix.png")
-            
-            # Also log as dict
-            mlflow.log_dict({
+
+            # Always log the numbers
+            _fast_log_dict({
                 "confusion_matrix": cm.tolist(),
                 "labels": labels if labels else []
             }, "confusion_matrix.json")
-            
-            plt.close(fig)
+
+            if render_figure:
+                import matplotlib
+                matplotlib.use('Agg', force=True)  # no Tk/Qt probing
+                import matplotlib.pyplot as plt
+                import seaborn as sns
+
+                fig, ax = plt.subplots(figsize=(8, 6))
+                sns.heatmap(cm, annot=True, fmt='d', cmap='Blues', ax=ax)
+                ax.set_xlabel('Predicted')
+                ax.set_ylabel('Actual')
+                ax.set_title('Confusion Matrix')
+
+                if labels:
+                    ax.set_xticklabels(labels)
+                    ax.set_yticklabels(labels)
+
+                mlflow.log_figure(fig, "confusion_matrix.png")
+                plt.close(fig)
+
             logger.info("Logged confusion matrix")
-            
+
         except Exception as e:
             logger.error(f"Error logging confusion matrix: {e}")
     
@@ -289,7 +375,7 @@ class MLflowTracker:
                 output_dict=True
             )
             
-            mlflow.log_dict(report, "classification_report.json")
+            _fast_log_dict(report, "classification_report.json")
             
             # Also log key metrics
             if 'accuracy' in report:
@@ -324,7 +410,7 @@ class MLflowTracker:
         """
         try:
             mlflow.set_tags(tags)
-            logger.debug(f"Set {len(tags)} tags")
+            logger.debug("Set %d tags", len(tags))
         except Exception as e:
             logger.error(f"Error setting tags: {e}")
 
@@ -357,26 +443,36 @@ def log_experiment(
         ...     tags={"model_type": "isolation_forest"}
         ... )
     """
-    tracker = MLflowTracker()
-    
-    with tracker.start_run(run_name):
-        # Log parameters
-        tracker.log_params(params)
-        
-        # Log metrics
-        tracker.log_metrics(metrics)
-        
+    tracker = MLflowTracker.get()
+
+    with tracker.start_run(run_name) as run:
+        # One batched backend call for params + metrics + tags instead
+        # of a round-trip per category
+        try:
+            from mlflow.tracking import MlflowClient
+            from mlflow.entities import Metric, Param, RunTag
+
+            timestamp = int(time.time() * 1000)
+            MlflowClient().log_batch(
+                run.info.run_id,
+                metrics=[Metric(k, float(v), timestamp, 0) for k, v in metrics.items()],
+                params=[Param(k, str(v)) for k, v in params.items()],
+                tags=[RunTag(k, str(v)) for k, v in (tags or {}).items()],
+            )
+        except Exception as e:
+            logger.error(f"Batched logging failed ({e}) - logging individually")
+            tracker.log_params(params)
+            tracker.log_metrics(metrics)
+            if tags:
+                tracker.set_tags(tags)
+
         # Log model if provided
         if model is not None:
             tracker.log_model(model, "model")
-        
+
         # Log artifacts if provided
         if artifacts:
             for name, path in artifacts.items():
                 tracker.log_artifact(path, name)
-        
-        # Set tags if provided
-        if tags:
-            tracker.set_tags(tags)
-        
+
         logger.info(f"Logged experiment: {run_name}")
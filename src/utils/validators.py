@@ -4,7 +4,9 @@ Implements Pydantic schemas for data validation and automated quality control
 following institutional standards (completeness ≥95%, consistency 100%).
 """
 
+import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Dict, List
 import pandas as pd
 import numpy as np
@@ -12,9 +14,88 @@ from pydantic import BaseModel, field_validator, Field
 
 from src.utils.logger import setup_logger
 
+# JIT-compiled fused scan when numba is available; the NumPy fallback
+# is still vectorized, just not single-pass
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = setup_logger(__name__)
 
 
+def _ohlcv_scan_numpy(high, low, close, vol):
+    """Violation counters over OHLCV arrays, vectorized per rule."""
+    # Returns computed in place: one buffer, no Series and no temporaries
+    returns = np.empty(max(close.shape[0] - 1, 0), dtype='float64')
+    np.divide(close[1:], close[:-1], out=returns)
+    returns -= 1.0
+    np.abs(returns, out=returns)
+    return (
+        int(np.count_nonzero(high < low)),
+        int(np.count_nonzero((close < low) | (close > high))),
+        int(np.count_nonzero(vol < 0)),
+        int(np.count_nonzero(vol == 0)),
+        int(np.count_nonzero(returns > 0.5)),
+    )
+
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _ohlcv_scan(high, low, close, vol):  # pragma: no cover - jit
+        """One fused pass: all five counters in a single loop over the rows."""
+        hl_violations = 0
+        close_violations = 0
+        neg_vol = 0
+        zero_vol = 0
+        extreme = 0
+        for i in numba.prange(high.shape[0]):
+            if high[i] < low[i]:
+                hl_violations += 1
+            if close[i] < low[i] or close[i] > high[i]:
+                close_violations += 1
+            if vol[i] < 0:
+                neg_vol += 1
+            if vol[i] == 0:
+                zero_vol += 1
+            if i > 0:
+                r = close[i] / close[i - 1] - 1.0
+                if r > 0.5 or r < -0.5:
+                    extreme += 1
+        return hl_violations, close_violations, neg_vol, zero_vol, extreme
+else:
+    _ohlcv_scan = _ohlcv_scan_numpy
+
+
+# Upper volume bound (10 billion shares), hoisted off the validator hot path
+_MAX_VOL = 10_000_000_000
+
+
+@lru_cache(maxsize=4096)
+def _valid_ticker(ticker: str) -> bool:
+    """Fixed-width check for the XXXX.JK ticker format.
+
+    Equivalent to the regex ^[A-Z]{4}\\.JK$, but plain length/suffix/
+    character-class tests beat regex-engine dispatch when validating
+    row-by-row, and the cache turns repeat tickers (an IDX dataset has
+    ~800 distinct symbols) into a single dict hit.
+
+    Args:
+        ticker: Candidate ticker string
+
+    Returns:
+        True when the ticker is well-formed
+    """
+    return (
+        len(ticker) == 7
+        and ticker.endswith('.JK')
+        and ticker.isascii()
+        and ticker[:4].isalpha()
+        and ticker[:4].isupper()
+    )
+
+
 class StockDataSchema(BaseModel):
     """Pydantic schema for validating OHLCV stock data.
     
@@ -29,7 +110,7 @@ class StockDataSchema(BaseModel):
         adjusted_close: Adjusted closing price (optional)
     """
     
-    ticker: str = Field(..., pattern=r'^[A-Z]{4}\.JK$')
+    ticker: str
     date: datetime
     open: float = Field(..., gt=0)
     high: float = Field(..., gt=0)
@@ -38,30 +119,42 @@ class StockDataSchema(BaseModel):
     volume: int = Field(..., ge=0)
     adjusted_close: Optional[float] = Field(None, gt=0)
     
+    @field_validator('ticker')
+    @classmethod
+    def ticker_well_formed(cls, v: str) -> str:
+        """Validate XXXX.JK format without per-call regex dispatch."""
+        if not _valid_ticker(v):
+            raise ValueError(f'Ticker {v!r} must match XXXX.JK format')
+        return v
+
     @field_validator('high')
     @classmethod
     def high_gte_low(cls, v: float, info) -> float:
         """Validate high >= low."""
-        if 'low' in info.data and v < info.data['low']:
-            raise ValueError(f'High price {v} must be >= low price {info.data["low"]}')
+        low = info.data.get('low')
+        if low is None:
+            return v
+        if v < low:
+            raise ValueError(f'High price {v} must be >= low price {low}')
         return v
-    
+
     @field_validator('close')
     @classmethod
     def close_within_range(cls, v: float, info) -> float:
         """Validate close within [low, high]."""
-        if 'low' in info.data and 'high' in info.data:
-            if v < info.data['low'] or v > info.data['high']:
-                raise ValueError(
-                    f'Close price {v} must be within [{info.data["low"]}, {info.data["high"]}]'
-                )
+        low = info.data.get('low')
+        high = info.data.get('high')
+        if low is None or high is None:
+            return v
+        if v < low or v > high:
+            raise ValueError(f'Close price {v} must be within [{low}, {high}]')
         return v
-    
+
     @field_validator('volume')
     @classmethod
     def volume_reasonable(cls, v: int) -> int:
         """Check for unrealistic volume."""
-        if v > 1e10:  # 10 billion shares
+        if v > _MAX_VOL:
             raise ValueError(f'Unrealistic volume: {v}')
         return v
     
@@ -69,6 +162,58 @@ class StockDataSchema(BaseModel):
         """Pydantic configuration."""
         validate_assignment = True
 
+    @classmethod
+    def validate_frame(cls, df: pd.DataFrame) -> None:
+        """Validate a whole OHLCV frame with vectorized checks.
+
+        Applies the same constraints as row-wise validation but as
+        column-level comparisons, avoiding one Pydantic model object per
+        row. Keep the row-wise schema for endpoints receiving single
+        records.
+
+        Args:
+            df: Frame with Ticker/Open/High/Low/Close/Volume columns
+                (capitalized, as produced by the fetch scripts)
+
+        Raises:
+            ValueError: Listing each violated rule with the offending
+                row indices
+        """
+        failures: Dict[str, np.ndarray] = {}
+
+        def _flag(rule: str, bad_mask) -> None:
+            bad = np.flatnonzero(np.asarray(bad_mask))
+            if bad.size:
+                failures[rule] = bad
+
+        open_ = df['Open'].to_numpy()
+        high = df['High'].to_numpy()
+        low = df['Low'].to_numpy()
+        close = df['Close'].to_numpy()
+        vol = df['Volume'].to_numpy()
+
+        _flag('open must be > 0', ~(open_ > 0))
+        _flag('high must be > 0', ~(high > 0))
+        _flag('low must be > 0', ~(low > 0))
+        _flag('close must be > 0', ~(close > 0))
+        _flag('high must be >= low', high < low)
+        _flag('close must be within [low, high]', (close < low) | (close > high))
+        _flag('volume must be >= 0', vol < 0)
+        _flag('volume must be <= 1e10', vol > 1e10)
+        _flag(
+            'ticker must match XXXX.JK format',
+            ~df['Ticker'].astype(str).map(_valid_ticker).to_numpy()
+        )
+
+        if failures:
+            details = '; '.join(
+                f"{rule} (rows {bad[:10].tolist()}{'...' if bad.size > 10 else ''})"
+                for rule, bad in failures.items()
+            )
+            raise ValueError(f'Frame validation failed: {details}')
+
+        logger.info("Frame validation passed for %d rows", len(df))
+
 
 class DataQualityChecker:
     """Automated data quality validation.
@@ -94,7 +239,11 @@ class DataQualityChecker:
         """
         self.data = data
         self.report: Dict = {}
-        logger.info(f"Initialized DataQualityChecker with {len(data)} rows")
+        # Row count cached for downstream checks; log lazily so the
+        # f-string never builds when INFO is filtered out
+        self._n = len(data)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Initialized DataQualityChecker with %d rows", self._n)
     
     def run_all_checks(self) -> Dict:
         """Run all quality checks and return comprehensive report.
@@ -103,54 +252,82 @@ class DataQualityChecker:
             Dictionary with check results and overall status
         """
         logger.info("Running all quality checks...")
-        
+
+        # One fused pass over the OHLCV columns feeds consistency and
+        # accuracy instead of each check rescanning the frame
+        scan = self._scan_ohlcv()
+
         self.check_completeness()
-        self.check_consistency()
+        self.check_consistency(scan)
         self.check_timeliness()
-        self.check_accuracy()
-        
+        self.check_accuracy(scan)
+
         return self._generate_report()
+
+    def _scan_ohlcv(self):
+        """Run the fused violation scan over contiguous column arrays.
+
+        Returns:
+            Tuple of (hl_violations, close_violations, neg_vol,
+            zero_vol, extreme_returns) counts
+        """
+        return _ohlcv_scan(
+            self.data['High'].to_numpy(dtype='float64'),
+            self.data['Low'].to_numpy(dtype='float64'),
+            self.data['Close'].to_numpy(dtype='float64'),
+            self.data['Volume'].to_numpy(dtype='float64'),
+        )
     
     def check_completeness(self) -> None:
         """Check for missing data (target: ≥95%)."""
-        total_rows = len(self.data)
-        missing_rows = self.data.isnull().sum()
-        
-        completeness = (1 - missing_rows / total_rows) * 100
-        
+        # Numeric columns: one np.isnan reduction over the raw ndarray
+        # instead of materializing a frame-sized boolean DataFrame.
+        # Non-numeric columns (Date, Ticker) keep the pandas null check.
+        numeric = self.data.select_dtypes(include=[np.number])
+
+        per_col: Dict[str, float] = {}
+        if len(numeric.columns):
+            missing_frac = np.isnan(numeric.to_numpy(dtype='float64')).mean(axis=0)
+            per_col.update(zip(numeric.columns, (1 - missing_frac) * 100))
+        for column in self.data.columns.difference(numeric.columns, sort=False):
+            per_col[column] = (1 - self.data[column].isnull().to_numpy().mean()) * 100
+
+        details = {c: float(per_col[c]) for c in self.data.columns}
+        score = float(np.mean(list(details.values())))
+
         self.report['completeness'] = {
-            'score': float(completeness.mean()),
-            'details': completeness.to_dict(),
-            'passed': completeness.mean() >= 95
+            'score': score,
+            'details': details,
+            'passed': score >= 95
         }
-        
-        logger.info(f"Completeness check: {completeness.mean():.2f}% (target: ≥95%)")
+
+        logger.info(f"Completeness check: {score:.2f}% (target: ≥95%)")
     
-    def check_consistency(self) -> None:
-        """Check data consistency rules (target: 100%)."""
+    def check_consistency(self, scan=None) -> None:
+        """Check data consistency rules (target: 100%).
+
+        Args:
+            scan: Precomputed _scan_ohlcv() counts (computed here if absent)
+        """
         inconsistencies: List[str] = []
-        
+
+        bad_hl, bad_close, neg_vol, _, _ = scan if scan is not None else self._scan_ohlcv()
+
         # Rule 1: High >= Low
-        invalid_hl = self.data[self.data['High'] < self.data['Low']]
-        if not invalid_hl.empty:
-            inconsistencies.append(f"High < Low: {len(invalid_hl)} rows")
-            logger.warning(f"Found {len(invalid_hl)} rows where High < Low")
-        
+        if bad_hl:
+            inconsistencies.append(f"High < Low: {bad_hl} rows")
+            logger.warning(f"Found {bad_hl} rows where High < Low")
+
         # Rule 2: Close within [Low, High]
-        invalid_close = self.data[
-            (self.data['Close'] < self.data['Low']) | 
-            (self.data['Close'] > self.data['High'])
-        ]
-        if not invalid_close.empty:
-            inconsistencies.append(f"Close outside [Low,High]: {len(invalid_close)} rows")
-            logger.warning(f"Found {len(invalid_close)} rows where Close outside range")
-        
+        if bad_close:
+            inconsistencies.append(f"Close outside [Low,High]: {bad_close} rows")
+            logger.warning(f"Found {bad_close} rows where Close outside range")
+
         # Rule 3: Volume >= 0
-        negative_vol = self.data[self.data['Volume'] < 0]
-        if not negative_vol.empty:
-            inconsistencies.append(f"Negative volume: {len(negative_vol)} rows")
-            logger.warning(f"Found {len(negative_vol)} rows with negative volume")
-        
+        if neg_vol:
+            inconsistencies.append(f"Negative volume: {neg_vol} rows")
+            logger.warning(f"Found {neg_vol} rows with negative volume")
+
         self.report['consistency'] = {
             'passed': len(inconsistencies) == 0,
             'issues': inconsistencies
@@ -166,7 +343,18 @@ class DataQualityChecker:
             self.report['timeliness'] = {'passed': False, 'reason': 'No date column'}
             return
         
-        latest_date = pd.to_datetime(self.data['Date']).max()
+        # Parse only when the column isn't already datetime64 (cache=True
+        # de-duplicates repeated date strings); max over the raw array
+        col = self.data['Date']
+        if not pd.api.types.is_datetime64_any_dtype(col):
+            col = pd.to_datetime(col, cache=True)
+        # Series .max() skips NaT (the ndarray max would propagate it);
+        # empty or all-NaT input is a failed check, not an exception
+        latest_date = col.max()
+        if pd.isna(latest_date):
+            logger.warning("No valid dates, skipping timeliness check")
+            self.report['timeliness'] = {'passed': False, 'reason': 'No rows'}
+            return
         days_old = (datetime.now() - latest_date).days
         
         self.report['timeliness'] = {
@@ -177,26 +365,129 @@ class DataQualityChecker:
         
         logger.info(f"Timeliness check: Latest data is {days_old} days old")
     
-    def check_accuracy(self) -> None:
-        """Statistical accuracy checks."""
-        # Check for unrealistic price movements
-        returns = self.data['Close'].pct_change()
-        extreme_returns = returns[abs(returns) > 0.5]  # >50% daily change
-        
-        # Check for zero volume days
-        zero_volume = self.data[self.data['Volume'] == 0]
-        
+    def check_accuracy(self, scan=None) -> None:
+        """Statistical accuracy checks.
+
+        Args:
+            scan: Precomputed _scan_ohlcv() counts (computed here if absent)
+        """
+        # Unrealistic price movements (>50% daily change) and zero
+        # volume days, both from the fused scan
+        _, _, _, zero_volume, extreme_returns = scan if scan is not None else self._scan_ohlcv()
+
         self.report['accuracy'] = {
-            'extreme_returns_count': len(extreme_returns),
-            'zero_volume_days': len(zero_volume),
-            'passed': len(extreme_returns) < 5  # Max 5 extreme days acceptable
+            'extreme_returns_count': extreme_returns,
+            'zero_volume_days': zero_volume,
+            'passed': extreme_returns < 5  # Max 5 extreme days acceptable
         }
-        
+
         logger.info(
-            f"Accuracy check: {len(extreme_returns)} extreme returns, "
-            f"{len(zero_volume)} zero volume days"
+            f"Accuracy check: {extreme_returns} extreme returns, "
+            f"{zero_volume} zero volume days"
         )
     
+    @classmethod
+    def check_all_tickers(cls, data: pd.DataFrame) -> Dict[str, Dict]:
+        """Run all quality checks for every ticker in one vectorized pass.
+
+        Produces the same per-ticker report as
+        ``DataQualityChecker(group).run_all_checks()``, but computes each
+        statistic as a single groupby aggregate over the combined frame
+        instead of re-scanning one DataFrame per ticker.
+
+        Args:
+            data: Combined DataFrame with a 'Ticker' column
+
+        Returns:
+            Mapping of ticker -> report dictionary
+        """
+        now = datetime.now()
+        tickers = data['Ticker']
+        grouped = data.groupby('Ticker', sort=False, observed=True)
+
+        logger.info(f"Running vectorized quality checks for {grouped.ngroups} tickers...")
+
+        # Completeness: non-null share per column per ticker
+        sizes = grouped.size()
+        completeness = grouped.count().div(sizes, axis=0) * 100
+        completeness['Ticker'] = 100.0  # grouping key is never null
+
+        # Consistency + zero-volume counts in one boolean frame
+        violations = pd.DataFrame({
+            'high_lt_low': data['High'] < data['Low'],
+            'close_outside': (data['Close'] < data['Low']) | (data['Close'] > data['High']),
+            'negative_volume': data['Volume'] < 0,
+            'zero_volume': data['Volume'] == 0,
+        }).groupby(tickers.values, sort=False).sum()
+
+        # Timeliness: latest date per ticker (tz stripped so the age
+        # subtraction against naive now() can't raise)
+        latest_dates = None
+        if 'Date' in data.columns:
+            dates = pd.to_datetime(data['Date'])
+            if dates.dt.tz is not None:
+                dates = dates.dt.tz_localize(None)
+            latest_dates = dates.groupby(tickers.values, sort=False).max()
+
+        # Accuracy: extreme daily returns, computed within each group
+        extreme_counts = (
+            grouped['Close'].pct_change().abs().gt(0.5)
+            .groupby(tickers.values, sort=False).sum()
+        )
+
+        reports: Dict[str, Dict] = {}
+        for ticker in sizes.index:
+            scores = completeness.loc[ticker]
+            mean_score = float(scores.mean())
+
+            counts = violations.loc[ticker]
+            issues: List[str] = []
+            if counts['high_lt_low']:
+                issues.append(f"High < Low: {int(counts['high_lt_low'])} rows")
+            if counts['close_outside']:
+                issues.append(f"Close outside [Low,High]: {int(counts['close_outside'])} rows")
+            if counts['negative_volume']:
+                issues.append(f"Negative volume: {int(counts['negative_volume'])} rows")
+
+            if latest_dates is not None:
+                latest = latest_dates.loc[ticker]
+                days_old = (now - latest).days
+                timeliness = {
+                    'latest_date': latest.strftime('%Y-%m-%d'),
+                    'days_old': days_old,
+                    'passed': days_old < 2
+                }
+            else:
+                timeliness = {'passed': False, 'reason': 'No date column'}
+
+            checks = {
+                'completeness': {
+                    'score': mean_score,
+                    'details': scores.to_dict(),
+                    'passed': mean_score >= 95
+                },
+                'consistency': {
+                    'passed': len(issues) == 0,
+                    'issues': issues
+                },
+                'timeliness': timeliness,
+                'accuracy': {
+                    'extreme_returns_count': int(extreme_counts.loc[ticker]),
+                    'zero_volume_days': int(counts['zero_volume']),
+                    'passed': extreme_counts.loc[ticker] < 5
+                },
+            }
+
+            all_passed = all(check.get('passed', False) for check in checks.values())
+            reports[ticker] = {
+                'overall_status': 'PASS' if all_passed else 'FAIL',
+                'timestamp': now.isoformat(),
+                'checks': checks
+            }
+            logger.info(f"Quality control for {ticker}: {reports[ticker]['overall_status']}")
+
+        return reports
+
     def _generate_report(self) -> Dict:
         """Generate comprehensive QC report.
         